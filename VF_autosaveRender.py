@@ -14,21 +14,22 @@ import bpy
 from bpy.app.handlers import persistent
 import datetime
 import time
+loadStart = time.perf_counter()
 import json
+import csv
+import threading
+from bisect import bisect_right
+from collections import deque, namedtuple
+from functools import wraps
+from math import exp, log
+from types import MappingProxyType, SimpleNamespace
 # File paths
 import os
 from pathlib import Path
 # Variable data
 import platform
-from re import findall, search, sub, M as multiline
-# FFmpeg system access
-import subprocess
-from shutil import which
-# Email notifications
-import smtplib
-from email.mime.text import MIMEText
-# Pushover notifications
-import requests
+from re import findall, finditer, search, sub, M as multiline
+# FFmpeg system access (subprocess, shutil.which), email notifications (smtplib, email.mime.text), and Pushover notifications (requests) are imported when first used
 
 # Format validation lists
 IMAGE_FORMATS = (
@@ -76,7 +77,168 @@ variableArray = ["title,Project,SCENE_DATA",
 				"title,System,DESKTOP",
 					"{host}", "{processor}", "{platform}", "{system}", "{release}", "{python}", "{blender}",
 				"title,Identifier,COPY_ID",
-					"{date}", "{y},{m},{d}", "{time}", "{H},{M},{S}", "{serial}", "{frame}", "{batch}"]
+					"{date}", "{y},{m},{d}", "{time}", "{H},{M},{S}", "{serial}", "{frame}", "{batch}",
+				"title,Statistics,INFO",
+					"{polycount}", "{objects}", "{lights}", "{memory}"]
+
+
+
+###########################################################################
+# Render state
+# •Transient render state is kept in module memory instead of Blender properties
+# •Preferences and project settings are read once per handler into plain Python snapshots
+# •Blender properties are only written when the displayed value changes
+
+renderState = {
+	"start": 0.0, # Render start time in seconds
+	"frame": None, # Starting frame, used for estimating time remaining
+	"sequence": False, # More than one frame has been rendered, enabling FFmpeg processing
+	"serial_used": False, # The {serial} variable was used in an output path
+	"cancelled": False, # Rendering was canceled
+	"finished": None, # Performance counter when rendering finished, before post-processing
+	"written": {}, # Paths of frames written during this render, keyed by frame number
+	"stream": None, # FFmpeg job encoding frames while rendering
+	"preferences": None} # Preferences snapshot taken at the start of rendering
+
+def settingsSnapshot(data):
+	return SimpleNamespace(**{name: getattr(data, name) for name in type(data).__annotations__})
+
+def updateSetting(data, name, value):
+	# Skip writes that wouldn't change anything (each write tags the interface for redrawing)
+	if getattr(data, name) != value:
+		setattr(data, name, value)
+
+
+
+###########################################################################
+# Profiling
+# •Optional timing of the add-on's own handlers and post-processing stages
+# •Call counts and cumulative times are collected per render
+# •Disabled profiling passes straight through to the original functions
+
+# Stage name: [call count, cumulative seconds]
+profileStats = {}
+
+# Background FFmpeg encode timings by render group (the render start time), kept until the group's FFmpeg results are reported
+profileJobs = {}
+
+# Group of the render profileStats currently belongs to
+profileState = {"enabled": False, "group": None}
+
+# FFmpeg job watcher threads record timings while the interface and render handlers read them
+profileLock = threading.Lock()
+
+class ProfileStage:
+	__slots__ = ("name", "start")
+	
+	def __init__(self, name):
+		self.name = name
+	
+	def __enter__(self):
+		self.start = time.perf_counter()
+	
+	def __exit__(self, *exc):
+		profileRecord(self.name, time.perf_counter() - self.start)
+
+class ProfileDisabled:
+	__slots__ = ()
+	
+	def __enter__(self):
+		pass
+	
+	def __exit__(self, *exc):
+		pass
+
+PROFILE_DISABLED = ProfileDisabled()
+
+def profile(name):
+	return ProfileStage(name) if profileState["enabled"] else PROFILE_DISABLED
+
+# Adds a stage timed elsewhere, such as background FFmpeg jobs that finish after the handler that started them (recorded under the group of the render that started them)
+def profileRecord(name, seconds, group=None):
+	with profileLock:
+		stats = (profileStats if group is None else profileJobs.setdefault(group, {})).setdefault(name, [0, 0.0])
+		stats[0] += 1
+		stats[1] += seconds
+
+def profileClear(group):
+	with profileLock:
+		profileStats.clear()
+		profileState["group"] = group
+
+# Returns (name, call count, cumulative seconds) for each stage, slowest first
+def profileResults():
+	with profileLock:
+		results = [(name, count, total) for name, (count, total) in profileStats.items()]
+	return sorted(results, key=lambda result: -result[2])
+
+# Removes and returns the encode timings of a render group for its FFmpeg report, also listing them with the stages of the current render
+def profileGroupResults(group):
+	with profileLock:
+		stats = profileJobs.pop(group, {})
+		if group == profileState["group"]:
+			for name, (count, total) in stats.items():
+				current = profileStats.setdefault(name, [0, 0.0])
+				current[0] += count
+				current[1] += total
+	return sorted(((name, count, total) for name, (count, total) in stats.items()), key=lambda result: -result[2])
+
+def profileLine(name, count, total):
+	return '  {:<32}{:>8} calls{:>12.3f} ms total{:>12.3f} ms average'.format(name, count, total * 1000.0, total * 1000.0 / count)
+
+# Function decorator, timing each call under the function name
+def profiled(function):
+	@wraps(function)
+	def wrapper(*args, **kwargs):
+		if not profileState["enabled"]:
+			return function(*args, **kwargs)
+		with ProfileStage(function.__name__):
+			return function(*args, **kwargs)
+	return wrapper
+
+def profileReport():
+	lines = ['VF Autosave Render profile (' + datetime.datetime.now().isoformat(timespec='seconds') + '):']
+	for name, count, total in profileResults():
+		lines.append(profileLine(name, count, total))
+	return '\n'.join(lines)
+
+@persistent
+def autosave_render_profile(scene):
+	if not profileState["enabled"] or not profileStats:
+		return
+	output = bpy.context.preferences.addons['VF_autosaveRender'].preferences.profile_output
+	if output == 'CONSOLE':
+		print(profileReport())
+	elif output == 'FILE' and bpy.data.filepath:
+		# Limited to locations local to the project file
+		profilepath = os.path.join(os.path.dirname(bpy.data.filepath), os.path.splitext(os.path.basename(bpy.data.filepath))[0] + '-Profile.txt')
+		try:
+			with open(profilepath, 'a') as fileout:
+				fileout.write(profileReport() + '\n\n')
+		except Exception as exc:
+			print(str(exc) + " | Error in VF Autosave Render: failed to save profile")
+
+
+
+###########################################################################
+# Project load function
+# •Clear cached node references
+# •Restore original output paths if a recovery file was left behind by a crash during rendering
+# •Precompile variable templates so rendering only has to expand them
+
+@persistent
+def autosave_render_load(dummy):
+	autosave_render_index_clear(dummy)
+	autosave_render_statistics_clear(dummy)
+	outputPathRegistry.clear()
+	try:
+		recoverOutputPaths()
+	except Exception as exc:
+		print(str(exc) + " | Error in VF Autosave Render: failed to restore output paths from the recovery file")
+	try:
+		precompileTemplates()
+	except Exception as exc:
+		print(str(exc) + " | Error in VF Autosave Render: failed to precompile variable templates")
 
 
 
@@ -87,92 +249,640 @@ variableArray = ["title,Project,SCENE_DATA",
 # •Replace output variables
 
 @persistent
+@profiled
 def autosave_render_start(scene):
-	# Save start time in seconds as a string to the addon settings
-	bpy.context.scene.autosave_render_settings.start_date = str(time.time())
+	# Read preferences and project settings once
+	prefs = renderState["preferences"] = settingsSnapshot(bpy.context.preferences.addons['VF_autosaveRender'].preferences)
+	settings = settingsSnapshot(scene.autosave_render_settings)
+	
+	# Save start time in seconds
+	renderState["start"] = time.time()
+	profileClear(renderState["start"])
+	renderEstimator.reset()
+	
+	# Start a new frame time journal buffer if enabled
+	startFrameJournal(prefs)
+	
+	# Capture render snapshot shared by all variable replacements during this render
+	global renderSnapshot
+	renderSnapshot = captureRenderSnapshot()
+	
+	# Clear per-frame templates from any previous render
+	frameTemplates.clear()
+	
 	# Set estimated render time active to false (must render at least one frame before estimating time remaining)
-	bpy.context.scene.autosave_render_settings.estimated_render_time_active = False
+	renderState["frame"] = None
+	updateSetting(scene.autosave_render_settings, "estimated_render_time_active", False)
 	# Set video sequence tracking (separate from render active above)
-	bpy.context.scene.autosave_render_settings.autosave_video_sequence = False
-	bpy.context.scene.autosave_render_settings.autosave_video_sequence_processing = False
+	renderState["sequence"] = False
+	renderState["written"] = {}
+	renderState["stream"] = None
 	
 	# Track usage of the output serial usage globally to ensure it can be accessed before/after rendering
 	# Set it to false ahead of processing to ensure no errors occur (usually only if there's a crash of some sort)
-	bpy.context.scene.autosave_render_settings.output_file_serial_used = False
+	renderState["serial_used"] = False
+	renderState["cancelled"] = False
+	
+	# Register original output paths in memory so they can be restored by direct reference after rendering
+	registry = outputPathRegistry[scene.as_pointer()] = {"filepath": None, "nodes": []}
 	
 	# Filter output file path if enabled
-	if bpy.context.preferences.addons['VF_autosaveRender'].preferences.render_output_variables:
+	if prefs.render_output_variables:
 		# Save original file path
-		bpy.context.scene.autosave_render_settings.output_file_path = filepath = scene.render.filepath
+		registry["filepath"] = filepath = scene.render.filepath
 		
 		# Check if the serial variable is used
 		if '{serial}' in filepath:
-			filepath = filepath.replace("{serial}", format(bpy.context.scene.autosave_render_settings.output_file_serial, '04'))
-			bpy.context.scene.autosave_render_settings.output_file_serial_used = True
+			filepath = filepath.replace("{serial}", format(settings.output_file_serial, '04'))
+			renderState["serial_used"] = True
 			
 		# Replace scene filepath output with the processed version
-		scene.render.filepath = replaceVariables(filepath)
+		scene.render.filepath = replaceVariables(filepath, snapshot=renderSnapshot)
+		trackFrameTemplate(scene.render, "filepath", filepath)
 		
 	# Filter compositing node file path if turned on in the plugin settings and compositing is enabled
-	if bpy.context.preferences.addons['VF_autosaveRender'].preferences.render_output_variables and bpy.context.scene.use_nodes:
-		# Iterate through Compositor nodes, adding all file output node path and sub-path variables to a dictionary
-		node_settings = {}
-		for node in bpy.context.scene.node_tree.nodes:
+	if prefs.render_output_variables and bpy.context.scene.use_nodes:
+		# Iterate through indexed File Output nodes (including nodes inside groups)
+		for tree, node in getFileOutputNodes(bpy.context.scene):
+			# Save the node tree, node reference, base_path property, and the path of each file slot
+			registry["nodes"].append((tree, node, node.base_path, [slot.path for slot in node.file_slots]))
+			
+			# Replace dynamic variables
+			if '{serial}' in node.base_path:
+				renderState["serial_used"] = True
+			base_path = node.base_path
+			node.base_path = replaceVariables(base_path, serial=settings.output_file_serial, snapshot=renderSnapshot)
+			trackFrameTemplate(node, "base_path", base_path, serial=settings.output_file_serial)
+			
+			# Process the sub-path property of each file slot
+			for slot in node.file_slots:
+				# Replace dynamic variables
+				if '{serial}' in slot.path:
+					renderState["serial_used"] = True
+				path = slot.path
+				slot.path = replaceVariables(path, serial=settings.output_file_serial, snapshot=renderSnapshot)
+				trackFrameTemplate(slot, "path", path, serial=settings.output_file_serial)
+	
+	# Save the original paths to disk if crash recovery is enabled
+	if prefs.output_path_journal:
+		writeOutputPathJournal(scene, registry)
+
+
+
+###########################################################################
+# File Output node index
+# •Find File Output nodes in the scene compositor, including nodes nested inside node groups
+# •Cache the node list per scene, only rebuilding it when the node structure changes
+
+# Indexed File Output nodes keyed by scene pointer, stored as ((trees, group nodes), signature, [(tree, node), ...], tree pointers) tuples
+fileOutputIndex = {}
+
+def buildFileOutputIndex(tree):
+	nodes = []
+	trees = []
+	groups = []
+	def scan(tree):
+		trees.append(tree)
+		for node in tree.nodes:
 			# Check if the node is a File Output node
 			if isinstance(node, bpy.types.CompositorNodeOutputFile):
-				# Save the base_path property and the file_slots dictionary entry
-				node_settings[node.name] = {
-					"base_path": node.base_path,
-					"file_slots": {}
-				}
-				# Replace dynamic variables
-				if '{serial}' in node.base_path:
-					bpy.context.scene.autosave_render_settings.output_file_serial_used = True
-				node.base_path = replaceVariables(node.base_path, serial=bpy.context.scene.autosave_render_settings.output_file_serial)
-				
-				# Save and then process the sub-path property of each file slot
-				for i, slot in enumerate(node.file_slots):
-					node_settings[node.name]["file_slots"][i] = {
-						"path": slot.path
-					}
-					# Replace dynamic variables
-					if '{serial}' in slot.path:
-						bpy.context.scene.autosave_render_settings.output_file_serial_used = True
-					slot.path = replaceVariables(slot.path, serial=bpy.context.scene.autosave_render_settings.output_file_serial)
-					
-		# Convert the dictionary to JSON format and save to the plugin preferences for safekeeping while rendering
-		bpy.context.scene.autosave_render_settings.output_file_nodes = json.dumps(node_settings)
+				nodes.append((tree, node))
+			# Scan each node group once, even if it's used by multiple group nodes
+			elif node.type == 'GROUP':
+				groups.append(node)
+				if node.node_tree and node.node_tree not in trees:
+					scan(node.node_tree)
+	scan(tree)
+	return (trees, groups), fileOutputSignature(trees, groups), nodes, frozenset(tree.as_pointer() for tree in trees)
+
+# Node counts and the newest node of each tree change whenever nodes are added, removed, or replaced (new nodes are always added last), and group assignments change when nodes are regrouped, but none of them change when paths are edited
+def fileOutputSignature(trees, groups):
+	return tuple((len(tree.nodes), tree.nodes[-1].as_pointer() if len(tree.nodes) else 0) for tree in trees) + tuple(group.node_tree.as_pointer() if group.node_tree else 0 for group in groups)
+
+def getFileOutputNodes(scene):
+	if not scene.node_tree:
+		return []
+	key = scene.as_pointer()
+	index = fileOutputIndex.get(key)
+	if index is None:
+		index = fileOutputIndex[key] = buildFileOutputIndex(scene.node_tree)
+	return index[2]
+
+@persistent
+def autosave_render_index_update(scene, depsgraph=None):
+	if not fileOutputIndex or depsgraph is None:
+		return
+	# Only check indexes whose scene or indexed node trees have been updated (compositor trees are embedded in their scene)
+	updated = {update.id.original.as_pointer() for update in depsgraph.updates if isinstance(update.id, (bpy.types.NodeTree, bpy.types.Scene))}
+	if updated:
+		for key, index in list(fileOutputIndex.items()):
+			if key not in updated and updated.isdisjoint(index[3]):
+				continue
+			try:
+				if fileOutputSignature(*index[0]) != index[1]:
+					del fileOutputIndex[key]
+			except ReferenceError:
+				# Removed nodes or node trees invalidate the index
+				del fileOutputIndex[key]
+
+@persistent
+def autosave_render_index_clear(dummy):
+	# Data is reallocated when loading files or using undo, so stored node references are no longer valid
+	fileOutputIndex.clear()
+
+
+
+###########################################################################
+# Output path registry
+# •Restore original output paths by direct reference after rendering
+# •Optional on-disk journal for recovering original paths after a crash during rendering
+
+# Original output paths keyed by scene pointer, holding the render filepath and (tree, node, base_path, [slot paths]) entries for File Output nodes
+outputPathRegistry = {}
+
+def restoreOutputPaths(scene):
+	registry = outputPathRegistry.pop(scene.as_pointer(), None)
+	if registry is None:
+		return
+	
+	if registry["filepath"] is not None:
+		scene.render.filepath = registry["filepath"]
+	
+	for tree, node, base_path, slot_paths in registry["nodes"]:
+		try:
+			node.base_path = base_path
+			for slot, path in zip(node.file_slots, slot_paths):
+				slot.path = path
+		except ReferenceError:
+			# Node was removed during rendering
+			pass
+	
+	# Original paths have been restored, so the recovery journal is no longer needed
+	journal = outputPathJournalPath()
+	if journal and os.path.exists(journal):
+		os.remove(journal)
+
+OUTPUT_PATH_JOURNAL_SUFFIX = '-OutputPaths.json'
+
+def outputPathJournalPrefix():
+	# Limited to locations local to the project file
+	if not bpy.data.filepath:
+		return None
+	return os.path.join(os.path.dirname(bpy.data.filepath), os.path.splitext(os.path.basename(bpy.data.filepath))[0] + '-' + getSystemVariables()["host"] + '-')
+
+def outputPathJournalPath():
+	# Each Blender instance keeps its own journal, so other computers or instances rendering the same project file don't recover it while it's in use
+	prefix = outputPathJournalPrefix()
+	if not prefix:
+		return None
+	return prefix + str(os.getpid()) + OUTPUT_PATH_JOURNAL_SUFFIX
+
+def processRunning(pid):
+	if platform.system() == 'Windows':
+		# Windows doesn't support signal 0, so the process exit code is checked instead
+		import ctypes
+		handle = ctypes.windll.kernel32.OpenProcess(0x1000, False, pid) # PROCESS_QUERY_LIMITED_INFORMATION
+		if not handle:
+			return False
+		code = ctypes.c_ulong()
+		running = ctypes.windll.kernel32.GetExitCodeProcess(handle, ctypes.byref(code)) and code.value == 259 # STILL_ACTIVE
+		ctypes.windll.kernel32.CloseHandle(handle)
+		return bool(running)
+	try:
+		os.kill(pid, 0)
+	except ProcessLookupError:
+		return False
+	except OSError:
+		# The process exists but belongs to another user
+		return True
+	return True
+
+def abandonedOutputPathJournals():
+	# Only journals written on this computer by Blender instances that are no longer running
+	prefix = outputPathJournalPrefix()
+	if not prefix or not os.path.isdir(os.path.dirname(prefix)):
+		return []
+	journals = []
+	for name in os.listdir(os.path.dirname(prefix)):
+		path = os.path.join(os.path.dirname(prefix), name)
+		if not path.startswith(prefix) or not name.endswith(OUTPUT_PATH_JOURNAL_SUFFIX):
+			continue
+		pid = path[len(prefix):-len(OUTPUT_PATH_JOURNAL_SUFFIX)]
+		if pid.isdigit() and int(pid) != os.getpid() and not processRunning(int(pid)):
+			journals.append(path)
+	# Oldest first, so the most recent journal is applied last
+	return sorted(journals, key=os.path.getmtime)
+
+def writeOutputPathJournal(scene, registry):
+	journal = outputPathJournalPath()
+	if not journal:
+		return
+	entries = [{"scene": scene.name, "filepath": registry["filepath"]}]
+	for tree, node, base_path, slot_paths in registry["nodes"]:
+		entries.append({
+			"scene": scene.name,
+			"tree": "" if tree == scene.node_tree else tree.name,
+			"node": node.name,
+			"base_path": base_path,
+			"file_slots": slot_paths})
+	try:
+		with open(journal, 'w') as fileout:
+			json.dump(entries, fileout)
+	except Exception as exc:
+		print(str(exc) + " | Error in VF Autosave Render: failed to save output path recovery file")
+
+def recoverOutputPaths():
+	for journal in abandonedOutputPathJournals():
+		recoverOutputPathJournal(journal)
+
+def recoverOutputPathJournal(journal):
+	with open(journal) as filein:
+		entries = json.load(filein)
+	for entry in entries:
+		scene = bpy.data.scenes.get(entry["scene"])
+		if not scene:
+			continue
+		if "node" not in entry:
+			if entry["filepath"] is not None:
+				scene.render.filepath = entry["filepath"]
+			continue
+		# Find the node in either the scene compositor or the node group it was saved from
+		tree = bpy.data.node_groups.get(entry["tree"]) if entry["tree"] else scene.node_tree
+		node = tree.nodes.get(entry["node"]) if tree else None
+		if isinstance(node, bpy.types.CompositorNodeOutputFile):
+			node.base_path = entry["base_path"]
+			for slot, path in zip(node.file_slots, entry["file_slots"]):
+				slot.path = path
+	
+	os.remove(journal)
+	print('VF Autosave Render: restored original output paths from ' + journal)
+
+
+
+###########################################################################
+# Per-frame functions
+# •Track output templates that use frame dependent variables
+# •Re-expand tracked templates before each frame renders, writing only changed values
+# •Start timing each frame for the render time estimate
+
+# Variables that can change from one frame to the next
+FRAME_VARIABLES = frozenset(("frame", "date", "y", "m", "d", "time", "H", "M", "S"))
+
+# Tracked templates as [owner, attribute, template, serial, current value] entries, rebuilt every render
+frameTemplates = []
+
+def trackFrameTemplate(owner, attribute, template, serial=-1):
+	if renderState["preferences"].render_output_variables_frame and compileTemplate(template).variables & FRAME_VARIABLES:
+		frameTemplates.append([owner, attribute, template, serial, getattr(owner, attribute)])
+
+@persistent
+@profiled
+def autosave_render_frame(scene):
+	renderEstimator.frameStart()
+	
+	if not frameTemplates:
+		return
+	
+	# Update the snapshot timestamp for the current frame
+	snapshot = dict(renderSnapshot) if renderSnapshot else {}
+	snapshot["_now"] = datetime.datetime.now()
+	
+	for entry in frameTemplates:
+		value = replaceVariables(entry[2], serial=entry[3], snapshot=snapshot)
+		# Only write to Blender data if the value has actually changed
+		if value != entry[4]:
+			setattr(entry[0], entry[1], value)
+			entry[4] = value
 
 
 
 ###########################################################################
 # During render function
+# •Per-frame render time statistics
 # •Remaining render time estimation
 
+# Number of recent frames averaged for the estimate
+ESTIMATE_WINDOW = 16
+
+class RenderEstimator:
+	def __init__(self, window=ESTIMATE_WINDOW):
+		self.times = deque(maxlen=window)
+		self.reset()
+	
+	def reset(self):
+		self.times.clear()
+		self.count = 0 # Frames completed
+		self.first = None # First frame time, including one-time setup like scene syncing, BVH building, and shader compilation
+		self.last = None # Most recent frame time
+		self.started = None # Performance counter at the start of the current frame
+		self.pending = None # Sorted list of frames expected to render
+	
+	def frameStart(self):
+		self.started = time.perf_counter()
+	
+	def frameEnd(self):
+		if self.started is None:
+			return
+		self.last = time.perf_counter() - self.started
+		self.started = None
+		self.count += 1
+		# The first frame is only used until a second frame time is available
+		if self.first is None:
+			self.first = self.last
+		else:
+			self.times.append(self.last)
+	
+	@property
+	def mean(self):
+		if self.times:
+			return sum(self.times) / len(self.times)
+		return self.first
+	
+	@property
+	def variance(self):
+		if len(self.times) < 2:
+			return 0.0
+		mean = self.mean
+		return sum((t - mean) ** 2 for t in self.times) / (len(self.times) - 1)
+	
+	def remainingFrames(self, scene):
+		# List the frames left in the sequence once, skipping frames that already exist on disk when overwriting is disabled
+		if self.pending is None:
+			frames = range(scene.frame_current + max(scene.frame_step, 1), scene.frame_end + 1, max(scene.frame_step, 1))
+			if not scene.render.use_overwrite:
+				frames = [frame for frame in frames if not os.path.exists(scene.render.frame_path(frame=frame))]
+			self.pending = list(frames)
+		return len(self.pending) - bisect_right(self.pending, scene.frame_current)
+	
+	def eta(self, scene):
+		if self.mean is None:
+			return None
+		return self.mean * self.remainingFrames(scene)
+
+renderEstimator = RenderEstimator()
+
 @persistent
+@profiled
 def autosave_render_estimate(scene):
-	# Save starting frame (before setting active to true, this should only happen once during a sequence)
-	if not bpy.context.scene.autosave_render_settings.estimated_render_time_active:
-		bpy.context.scene.autosave_render_settings.estimated_render_time_frame = bpy.context.scene.frame_current
+	frame = scene.frame_current
+	renderEstimator.frameEnd()
+	
+	# Save starting frame (this should only happen once during a sequence)
+	if renderState["frame"] is None:
+		renderState["frame"] = frame
 	
 	# If video sequence is inactive and our current frame is not our starting frame, assume we're rendering a sequence
-	if not bpy.context.scene.autosave_render_settings.autosave_video_sequence and bpy.context.scene.autosave_render_settings.estimated_render_time_frame < bpy.context.scene.frame_current:
-		bpy.context.scene.autosave_render_settings.autosave_video_sequence = True
+	if not renderState["sequence"] and renderState["frame"] < frame:
+		renderState["sequence"] = True
 	
 	# If it's not the last frame, estimate time remaining
-	if bpy.context.scene.frame_current < bpy.context.scene.frame_end:
-		bpy.context.scene.autosave_render_settings.estimated_render_time_active = True
-		# Elapsed time (Current - Render Start)
-		render_time = time.time() - float(bpy.context.scene.autosave_render_settings.start_date)
-		# Divide by number of frames completed
-		render_time /= bpy.context.scene.frame_current - bpy.context.scene.autosave_render_settings.estimated_render_time_frame + 1.0
-		# Multiply by number of frames assumed unrendered (does not account for previously completed frames beyond the current frame)
-		render_time *= bpy.context.scene.frame_end - bpy.context.scene.frame_current
-		# Convert to readable and store
-		bpy.context.scene.autosave_render_settings.estimated_render_time_value = secondsToReadable(render_time)
-		# print('Estimated Time Remaining: ' + bpy.context.scene.autosave_render_settings.estimated_render_time_value)
+	eta = renderEstimator.eta(scene) if frame < scene.frame_end else None
+	if eta is not None:
+		# Convert to readable and store (the only values written to Blender data during rendering)
+		updateSetting(scene.autosave_render_settings, "estimated_render_time_value", secondsToReadable(eta))
+		updateSetting(scene.autosave_render_settings, "estimated_render_time_active", True)
 	else:
-		bpy.context.scene.autosave_render_settings.estimated_render_time_active = False
+		updateSetting(scene.autosave_render_settings, "estimated_render_time_active", False)
+
+
+
+###########################################################################
+# Frame time journal
+# •Record one entry per rendered frame
+# •Buffer entries in memory and append them to the journal file in batches so file access doesn't slow down rendering
+
+FRAME_JOURNAL_FIELDS = ("frame", "wall", "time", "elapsed", "camera", "batch", "host")
+
+# Minimum number of seconds between journal file writes
+FRAME_JOURNAL_INTERVAL = 5.0
+
+frameJournal = {
+	"path": None, # Journal file path, or None when the journal is disabled
+	"format": 'JSONL',
+	"entries": [],
+	"flushed": 0.0}
+
+def frameJournalPath(prefs):
+	# Limited to locations local to the project file
+	if not bpy.data.filepath:
+		return None
+	projectname = os.path.splitext(os.path.basename(bpy.data.filepath))[0]
+	extension = '.csv' if prefs.frame_journal_format == 'CSV' else '.jsonl'
+	return os.path.join(os.path.dirname(bpy.data.filepath), prefs.frame_journal_name.replace("{project}", projectname) + extension)
+
+def startFrameJournal(prefs):
+	frameJournal["path"] = frameJournalPath(prefs) if prefs.frame_journal else None
+	frameJournal["format"] = prefs.frame_journal_format
+	frameJournal["entries"].clear()
+	frameJournal["flushed"] = time.perf_counter()
+
+@profiled
+def flushFrameJournal():
+	entries = frameJournal["entries"]
+	path = frameJournal["path"]
+	if entries and path:
+		try:
+			exists = os.path.exists(path)
+			# Create journal file directory location if it doesn't exist
+			if not exists and not os.path.exists(os.path.dirname(path)):
+				os.makedirs(os.path.dirname(path))
+			with open(path, 'a', newline='') as fileout:
+				if frameJournal["format"] == 'CSV':
+					writer = csv.DictWriter(fileout, FRAME_JOURNAL_FIELDS)
+					if not exists:
+						writer.writeheader()
+					writer.writerows(entries)
+				else:
+					fileout.writelines(json.dumps(entry) + '\n' for entry in entries)
+		except Exception as exc:
+			print(str(exc) + " | Error in VF Autosave Render: failed to save frame time journal")
+	entries.clear()
+	frameJournal["flushed"] = time.perf_counter()
+
+@persistent
+@profiled
+def autosave_render_journal(scene):
+	if frameJournal["path"] is None:
+		return
+	
+	frameJournal["entries"].append({
+		"frame": scene.frame_current,
+		"wall": datetime.datetime.now().isoformat(timespec='seconds'),
+		"time": round(renderEstimator.last, 3) if renderEstimator.last is not None else None,
+		"elapsed": round(time.time() - renderState["start"], 3),
+		"camera": scene.camera.name if scene.camera else None,
+		"batch": scene.autosave_render_settings.batch_index,
+		"host": getSystemVariables()["host"]})
+	
+	if time.perf_counter() - frameJournal["flushed"] >= FRAME_JOURNAL_INTERVAL:
+		flushFrameJournal()
+
+
+
+###########################################################################
+# Render history and prediction
+# •Record render settings and timings of completed renders
+# •Predict render time from a regression fitted on previous renders with similar settings
+
+# Number of most recent renders used for predictions
+RENDER_HISTORY_LIMIT = 1000
+
+# Regularisation of the regression coefficients, keeping predictions stable with little or repetitive history
+RENDER_HISTORY_RIDGE = 0.1
+
+# Seconds between checks for changes to the history file (predictions are requested on every panel redraw)
+RENDER_HISTORY_CHECK_INTERVAL = 2.0
+
+# Bytes read at a time when loading the end of the history file
+RENDER_HISTORY_READ_SIZE = 65536
+
+# Loaded history records, fitted models, and predicted seconds per frame by render features, reloaded when the history file changes
+renderHistory = {"path": None, "mtime": None, "checked": 0.0, "records": [], "models": {}, "predictions": {}}
+
+def renderHistoryPath(prefs):
+	if prefs.render_history_file:
+		return bpy.path.abspath(prefs.render_history_file)
+	# Shared by all projects on this computer
+	return os.path.join(bpy.utils.user_resource('CONFIG'), 'VF_autosaveRender-RenderHistory.jsonl')
+
+def sequenceFrameCount(scene):
+	return len(range(scene.frame_start, scene.frame_end + 1, max(scene.frame_step, 1)))
+
+def renderFeatures(scene):
+	# Numeric settings are taken from the same values used for the {samples} and {features} variables
+	engine, device, samples, features = getRenderEngineData()
+	sampleValues = [float(value) for value in findall(r'\d+(?:\.\d+)?', samples)]
+	bounceValues = [int(value) for value in features.split('+') if value.isdigit()]
+	scale = scene.render.resolution_percentage / 100.0
+	return {
+		"engine": engine,
+		"device": device,
+		"host": getSystemVariables()["host"],
+		"megapixels": round(scene.render.resolution_x * scene.render.resolution_y * scale * scale / 1000000.0, 4),
+		"samples": max(sampleValues) if sampleValues else 1.0,
+		"bounces": bounceValues[0] if bounceValues else 0}
+
+def recordRenderHistory(prefs, scene, seconds, frames):
+	record = renderFeatures(scene)
+	record.update({
+		"date": datetime.datetime.now().isoformat(timespec='seconds'),
+		"project": os.path.splitext(os.path.basename(bpy.data.filepath))[0],
+		"frames": frames,
+		"seconds": round(seconds, 3)})
+	path = renderHistoryPath(prefs)
+	try:
+		if not os.path.exists(os.path.dirname(path)):
+			os.makedirs(os.path.dirname(path))
+		with open(path, 'a') as fileout:
+			fileout.write(json.dumps(record) + '\n')
+		# Check for the new record on the next prediction
+		renderHistory["checked"] = 0.0
+	except Exception as exc:
+		print(str(exc) + " | Error in VF Autosave Render: failed to save render history")
+
+def readRenderHistoryLines(path):
+	# Reads backwards from the end of the file until enough lines are found, so long histories aren't read in full
+	with open(path, 'rb') as filein:
+		position = filein.seek(0, os.SEEK_END)
+		data = b''
+		while position > 0 and data.count(b'\n') <= RENDER_HISTORY_LIMIT:
+			size = min(RENDER_HISTORY_READ_SIZE, position)
+			position -= size
+			filein.seek(position)
+			data = filein.read(size) + data
+	lines = data.decode('utf-8').splitlines()
+	# Skip the partial line at the start of the last block read
+	if position > 0:
+		lines = lines[1:]
+	return [line for line in lines if line.strip()][-RENDER_HISTORY_LIMIT:]
+
+def loadRenderHistory(path):
+	now = time.perf_counter()
+	if path == renderHistory["path"] and now - renderHistory["checked"] < RENDER_HISTORY_CHECK_INTERVAL:
+		return renderHistory["records"]
+	renderHistory["checked"] = now
+	try:
+		mtime = os.stat(path).st_mtime
+	except OSError:
+		mtime = None
+	if path != renderHistory["path"] or mtime != renderHistory["mtime"]:
+		records = []
+		if mtime is not None:
+			try:
+				for line in readRenderHistoryLines(path):
+					record = json.loads(line)
+					if record.get("frames") and record.get("seconds"):
+						records.append(record)
+			except Exception as exc:
+				print(str(exc) + " | Error in VF Autosave Render: failed to load render history")
+		renderHistory.update({"path": path, "mtime": mtime, "records": records, "models": {}, "predictions": {}})
+	return renderHistory["records"]
+
+def regressionInputs(record):
+	return 1.0, log(max(record["megapixels"], 0.0001)), log(max(record["samples"], 1.0)), float(record["bounces"])
+
+def fitRegression(records):
+	# Least squares fit of the logarithm of seconds per frame, solved from the normal equations
+	size = 4
+	matrix = [[0.0] * size for i in range(size)]
+	vector = [0.0] * size
+	for record in records:
+		inputs = regressionInputs(record)
+		target = log(max(record["seconds"] / record["frames"], 0.001))
+		for i in range(size):
+			vector[i] += inputs[i] * target
+			for j in range(size):
+				matrix[i][j] += inputs[i] * inputs[j]
+	# Regularise everything except the intercept
+	for i in range(1, size):
+		matrix[i][i] += RENDER_HISTORY_RIDGE
+	return solveLinear(matrix, vector)
+
+def solveLinear(matrix, vector):
+	# Gaussian elimination with partial pivoting
+	size = len(vector)
+	rows = [matrix[i][:] + [vector[i]] for i in range(size)]
+	for column in range(size):
+		pivot = max(range(column, size), key=lambda row: abs(rows[row][column]))
+		rows[column], rows[pivot] = rows[pivot], rows[column]
+		if abs(rows[column][column]) < 1e-12:
+			return None
+		for row in range(column + 1, size):
+			factor = rows[row][column] / rows[column][column]
+			for k in range(column, size + 1):
+				rows[row][k] -= factor * rows[column][k]
+	solution = [0.0] * size
+	for row in reversed(range(size)):
+		solution[row] = (rows[row][size] - sum(rows[row][k] * solution[k] for k in range(row + 1, size))) / rows[row][row]
+	return solution
+
+# Returns (predicted seconds, number of renders the prediction is based on), or None without matching history
+def predictRenderTime(scene, frames):
+	prefs = bpy.context.preferences.addons['VF_autosaveRender'].preferences
+	if not prefs.render_history:
+		return None
+	records = loadRenderHistory(renderHistoryPath(prefs))
+	if not records:
+		return None
+	features = renderFeatures(scene)
+	key = tuple(features.values())
+	if key not in renderHistory["predictions"]:
+		renderHistory["predictions"][key] = predictFrameTime(features)
+	prediction = renderHistory["predictions"][key]
+	return (prediction[0] * frames, prediction[1]) if prediction else None
+
+def predictFrameTime(features):
+	models = renderHistory["models"]
+	# Prefer renders with the same engine, device, and host, falling back to broader groups
+	for keys in (("engine", "device", "host"), ("engine", "device"), ("engine",)):
+		group = tuple(features[key] for key in keys)
+		if group not in models:
+			matching = [record for record in renderHistory["records"] if all(record.get(key) == features[key] for key in keys)]
+			models[group] = (fitRegression(matching) if matching else None, len(matching))
+		coefficients, count = models[group]
+		if coefficients:
+			return exp(sum(coefficient * value for coefficient, value in zip(coefficients, regressionInputs(features)))), count
+	return None
 
 
 
@@ -186,207 +896,136 @@ def autosave_render_estimate(scene):
 # •Save log file
 
 @persistent
+def autosave_render_cancel(scene):
+	# Canceled renders are left out of the render history (this runs before autosave_render_end)
+	renderState["cancelled"] = True
+	renderState["finished"] = time.perf_counter()
+
+@persistent
+def autosave_render_complete(scene):
+	# Separates rendering from post-processing in batch timings (this runs before autosave_render_end)
+	renderState["finished"] = time.perf_counter()
+
+@persistent
+@profiled
 def autosave_render_end(scene):
+	# Read preferences and project settings once
+	prefs = settingsSnapshot(bpy.context.preferences.addons['VF_autosaveRender'].preferences)
+	settings = settingsSnapshot(scene.autosave_render_settings)
+	
 	# Set estimated render time active to false (render is complete or canceled, estimate display and FFmpeg check is no longer needed)
-	bpy.context.scene.autosave_render_settings.estimated_render_time_active = False
+	updateSetting(scene.autosave_render_settings, "estimated_render_time_active", False)
 	
 	# Calculate elapsed render time
-	render_time = round(time.time() - float(bpy.context.scene.autosave_render_settings.start_date), 2)
+	render_time = round(time.time() - renderState["start"], 2)
+	
+	# Refresh render snapshot, keeping the render start timestamp so post-render paths match the output paths
+	global renderSnapshot
+	renderSnapshot = captureRenderSnapshot(now=renderSnapshot["_now"] if renderSnapshot else None)
 	
 	# Update total render time
-	bpy.context.scene.autosave_render_settings.total_render_time = bpy.context.scene.autosave_render_settings.total_render_time + render_time
+	scene.autosave_render_settings.total_render_time = settings.total_render_time + render_time
+	
+	# Record completed renders for render time predictions
+	if prefs.render_history and not renderState["cancelled"] and renderEstimator.count:
+		with profile('render history'):
+			recordRenderHistory(prefs, scene, render_time, renderEstimator.count)
+	
+	# Validate the FFmpeg location before use (cached after the first check)
+	if prefs.ffmpeg_processing and renderState["sequence"]:
+		checkExternalTools(ffmpeg=True, say=False)
+		prefs.ffmpeg_location = bpy.context.preferences.addons['VF_autosaveRender'].preferences.ffmpeg_location
+		prefs.ffmpeg_exists = bpy.context.preferences.addons['VF_autosaveRender'].preferences.ffmpeg_exists
 	
 	# Output video files if FFmpeg processing is enabled, the command appears to exist, and the image format output is supported
-	if bpy.context.preferences.addons['VF_autosaveRender'].preferences.ffmpeg_processing and bpy.context.preferences.addons['VF_autosaveRender'].preferences.ffmpeg_exists and bpy.context.scene.render.image_settings.file_format in FFMPEG_FORMATS and bpy.context.scene.autosave_render_settings.autosave_video_sequence:
+	if prefs.ffmpeg_processing and prefs.ffmpeg_exists and bpy.context.scene.render.image_settings.file_format in FFMPEG_FORMATS and renderState["sequence"]:
 		# Create initial command base
-		ffmpeg_location = bpy.context.preferences.addons['VF_autosaveRender'].preferences.ffmpeg_location
-		# Create absolute path and strip trailing spaces
-		absolute_path = bpy.path.abspath(scene.render.filepath).rstrip()
-		# Replace frame number placeholder with asterisk or add trailing asterisk
-		if "#" in absolute_path:
-			absolute_path = sub(r'#+(?!.*#)', "*", absolute_path)
-		else:
-			absolute_path += "*"
-		# Create input image glob pattern
-		glob_pattern = '-pattern_type glob -i "' + absolute_path + scene.render.file_extension + '"'
+		ffmpeg_location = prefs.ffmpeg_location
+		# Limit decoding and encoding threads per job if set (0 leaves the choice to FFmpeg)
+		thread_args = ['-threads', str(prefs.ffmpeg_threads)] if prefs.ffmpeg_threads else []
+		# Create image sequence input from the frames rendered
+		sequence_input = ffmpegSequenceInput(scene)
+		input_args = thread_args + (sequence_input or [])
 		# Create floating point FPS value
-		fps_float = '-r ' + str(scene.render.fps / scene.render.fps_base)
+		fps_args = ['-r', str(scene.render.fps / scene.render.fps_base)]
+		# Default output alongside the image sequence, named after the sequence without frame numbers (strip trailing spaces)
+		sequence_path = scene.render.filepath
+		# Output paths updated every frame hold the values of the last frame, so the name is expanded again from the original path using the render start time, leaving out the frame number
+		for owner, attribute, template, serial, value in frameTemplates:
+			if owner is scene.render and attribute == "filepath":
+				sequence_path = replaceVariables(template.replace("{frame}", ""), snapshot=renderSnapshot)
+		sequence_path = sub(r'#+(?!.*#)', "", bpy.path.abspath(sequence_path).rstrip())
 		
-		# ProRes output
-		if bpy.context.scene.autosave_render_settings.autosave_video_prores:
-			# Set FFmpeg processing to true so the Image View window can display status
-			bpy.context.scene.autosave_render_settings.autosave_video_sequence_processing = True
-			if len(bpy.context.scene.autosave_render_settings.autosave_video_prores_location) > 1:
-				# Replace with custom string
-				output_path = bpy.context.scene.autosave_render_settings.autosave_video_prores_location
-				# Replace dynamic variables
-				if '{serial}' in output_path:
-					bpy.context.scene.autosave_render_settings.output_file_serial_used = True
-				output_path = replaceVariables(output_path, rendertime=render_time, serial=bpy.context.scene.autosave_render_settings.output_file_serial)
-				# Convert relative path into absolute path for Python and CLI compatibility
-				output_path = bpy.path.abspath(output_path)
-				# Create the project subfolder if it doesn't already exist
-				output_dir = sub(r'[^/]*$', "", output_path)
-				if not os.path.exists(output_dir):
-					os.makedirs(output_dir)
-				# Wrap with FFmpeg settings
-				output_path = '-y "' + output_path + '"'
-			
-			# FFmpeg location
-			ffmpeg_command = ffmpeg_location
-			# Frame rate
-			ffmpeg_command += ' ' + fps_float
-			# Image sequence pattern
-			ffmpeg_command += ' ' + glob_pattern
-			# ProRes format
-			ffmpeg_command += ' -c:v prores -pix_fmt yuv422p10le'
-			# ProRes profile (Proxy, LT, 422 HQ)
-			ffmpeg_command += ' -profile:v ' + str(bpy.context.scene.autosave_render_settings.autosave_video_prores_quality)
-			# Final output settings
-			ffmpeg_command += ' -vendor apl0 -an -sn'
-			# Output file path
-			ffmpeg_command += ' ' + output_path + '.mov'
-			# Remove any accidental double spaces
-			ffmpeg_command = sub(r'\s{2,}', " ", ffmpeg_command)
-			
-			# Print command to the terminal
-			print('FFmpeg ProRes command:')
-			print(ffmpeg_command)
-			print('')
-			
-			# Run FFmpeg command
-			try:
-				subprocess.call(ffmpeg_command, shell=True)
-				print('')
-			except Exception as exc:
-				print(str(exc) + " | Error in VF Autosave Render: failed to process FFmpeg ProRes command")
+		def outputPath(name, location):
+			# Save alongside the image sequence unless a custom location is set
+			if len(location) <= 1:
+				return sequence_path
+			# Replace dynamic variables
+			if '{serial}' in location:
+				renderState["serial_used"] = True
+			output_path = replaceVariables(location, rendertime=render_time, serial=settings.output_file_serial, snapshot=renderSnapshot)
+			# Convert relative path into absolute path for Python and CLI compatibility
+			output_path = bpy.path.abspath(output_path)
+			# Create the project subfolder if it doesn't already exist
+			output_dir = sub(r'[^/]*$', "", output_path)
+			if not os.path.exists(output_dir):
+				os.makedirs(output_dir)
+			return output_path
 		
-		# MP4 output
-		if bpy.context.scene.autosave_render_settings.autosave_video_mp4:
-			# Set FFmpeg processing to true so the Image View window can display status
-			bpy.context.scene.autosave_render_settings.autosave_video_sequence_processing = True
-			if len(bpy.context.scene.autosave_render_settings.autosave_video_mp4_location) > 1:
-				# Replace with custom string
-				output_path = bpy.context.scene.autosave_render_settings.autosave_video_mp4_location
-				# Replace dynamic variables
-				if '{serial}' in output_path:
-					bpy.context.scene.autosave_render_settings.output_file_serial_used = True
-				output_path = replaceVariables(output_path, rendertime=render_time, serial=bpy.context.scene.autosave_render_settings.output_file_serial)
-				# Convert relative path into absolute path for Python and CLI compatibility
-				output_path = bpy.path.abspath(output_path)
-				# Create the project subfolder if it doesn't already exist
-				output_dir = sub(r'[^/]*$', "", output_path)
-				if not os.path.exists(output_dir):
-					os.makedirs(output_dir)
-				# Wrap with FFmpeg settings
-				output_path = '-y "' + output_path + '"'
-			
-			# FFmpeg location
-			ffmpeg_command = ffmpeg_location
-			# Frame rate
-			ffmpeg_command += ' ' + fps_float
-			# Image sequence pattern
-			ffmpeg_command += ' ' + glob_pattern
-			# MP4 format
-			ffmpeg_command += ' -c:v libx264 -preset slow'
-			# MP4 quality (0-51 from highest to lowest quality)
-			ffmpeg_command += ' -crf ' + str(bpy.context.scene.autosave_render_settings.autosave_video_mp4_quality)
-			# Final output settings
-			ffmpeg_command += ' -pix_fmt yuv420p -movflags rtphint'
-			# Output file path
-			ffmpeg_command += ' ' + output_path + '.mp4'
-			# Remove any accidental double or more spaces
-			ffmpeg_command = sub(r'\s{2,}', " ", ffmpeg_command)
-			
-			# Print command to the terminal
-			print('FFmpeg MP4 command:')
-			print(ffmpeg_command)
-			print('')
-			
-			# Run FFmpeg command
-			try:
-				subprocess.call(ffmpeg_command, shell=True)
-				print('')
-			except Exception as exc:
-				print(str(exc) + " | Error in VF Autosave Render: failed to process FFmpeg MP4 command")
+		# Videos to encode, stored as (name, command, video filter, output options, output file)
+		outputs = ffmpegOutputs(settings, ffmpeg_location, fps_args, input_args, thread_args, outputPath)
 		
-		# Custom output
-		if bpy.context.scene.autosave_render_settings.autosave_video_custom:
-			# Set FFmpeg processing to true so the Image View window can display status
-			bpy.context.scene.autosave_render_settings.autosave_video_sequence_processing = True
-			if len(bpy.context.scene.autosave_render_settings.autosave_video_custom_location) > 1:
-				# Replace with custom string
-				output_path = bpy.context.scene.autosave_render_settings.autosave_video_custom_location
-				# Replace dynamic variables
-				if '{serial}' in output_path:
-					bpy.context.scene.autosave_render_settings.output_file_serial_used = True
-				output_path = replaceVariables(output_path, rendertime=render_time, serial=bpy.context.scene.autosave_render_settings.output_file_serial)
-				# Convert relative path into absolute path for Python and CLI compatibility
-				output_path = bpy.path.abspath(output_path)
-				# Create the project subfolder if it doesn't already exist
-				output_dir = sub(r'[^/]*$', "", output_path)
-				if not os.path.exists(output_dir):
-					os.makedirs(output_dir)
-				# Wrap with FFmpeg settings
-				output_path = '-y "' + output_path + '"'
-			
-			# FFmpeg location
-			ffmpeg_command = ffmpeg_location + ' ' + bpy.context.scene.autosave_render_settings.autosave_video_custom_command
-			# Replace variables
-			ffmpeg_command = ffmpeg_command.replace("{fps}", fps_float)
-			ffmpeg_command = ffmpeg_command.replace("{input}", glob_pattern)
-			ffmpeg_command = ffmpeg_command.replace("{output}", output_path)
-			# Remove any accidental double spaces
-			ffmpeg_command = sub(r'\s{2,}', " ", ffmpeg_command)
-			
+		# Skip encoding if none of the rendered frames can be found
+		if sequence_input is None:
+			print('Error in VF Autosave Render: no rendered frames found for FFmpeg processing')
+			outputs = []
+		
+		# Videos streamed during rendering only need to be moved to their final locations, falling back to encoding the saved frames if streaming fails
+		stream = renderState["stream"]
+		if stream:
+			streamed = [output for output in outputs if output[0] in stream.outputs]
+			outputs = [output for output in outputs if output[0] not in stream.outputs]
+			ffmpegRunner.finishStream(stream, [(stream.outputs[output[0]], output[4]) for output in streamed], fallback=ffmpegJobs([ffmpeg_location] + fps_args + input_args, streamed, prefs.ffmpeg_combined), limit=prefs.ffmpeg_jobs)
+			renderState["stream"] = None
+		
+		for name, ffmpeg_command in ffmpegJobs([ffmpeg_location] + fps_args + input_args, outputs, prefs.ffmpeg_combined):
 			# Print command to the terminal
-			print('FFmpeg custom command:')
-			print(ffmpeg_command)
+			print('FFmpeg ' + name + ' command:')
+			print(ffmpegCommandString(ffmpeg_command))
 			print('')
 			
-			# Run FFmpeg command
-			try:
-				subprocess.call(ffmpeg_command, shell=True)
-				print('')
-			except Exception as exc:
-				print(str(exc) + " | Error in VF Autosave Render: failed to process FFmpeg custom command")
+			# Start FFmpeg command in the background
+			with profile('FFmpeg submit'):
+				ffmpegRunner.submit(name, ffmpeg_command, group=renderState["start"], limit=prefs.ffmpeg_jobs)
+	
+	# Close a stream left open if video processing was skipped (removing the temporary files)
+	if renderState["stream"]:
+		ffmpegRunner.finishStream(renderState["stream"], [])
+		renderState["stream"] = None
 	
 	# Increment the output serial number if it was used any output path
-	if bpy.context.scene.autosave_render_settings.output_file_serial_used:
-		bpy.context.scene.autosave_render_settings.output_file_serial += 1
+	if renderState["serial_used"]:
+		# Keep the snapshot in step so notifications use the incremented serial number
+		settings.output_file_serial = scene.autosave_render_settings.output_file_serial = settings.output_file_serial + 1
+	
+	# Stop tracking per-frame templates before the original paths are restored
+	frameTemplates.clear()
+	
+	# Write any remaining frame time journal entries
+	flushFrameJournal()
+	frameJournal["path"] = None
 	
 	# Set video sequence status to false
-	bpy.context.scene.autosave_render_settings.autosave_video_sequence = False
-	bpy.context.scene.autosave_render_settings.autosave_video_sequence_processing = False
-	
-	# Restore unprocessed file path if processing is enabled
-	if bpy.context.preferences.addons['VF_autosaveRender'].preferences.render_output_variables and bpy.context.scene.autosave_render_settings.output_file_path:
-		scene.render.filepath = bpy.context.scene.autosave_render_settings.output_file_path
-	
-	# Restore unprocessed node output file path if processing is enabled, compositing is enabled, and a file output node exists with the default node name
-	if bpy.context.preferences.addons['VF_autosaveRender'].preferences.render_output_variables and bpy.context.scene.use_nodes and len(bpy.context.scene.autosave_render_settings.output_file_nodes) > 2:
-		
-		# Get the JSON data from the preferences string where it was stashed
-		json_data = bpy.context.scene.autosave_render_settings.output_file_nodes
-		
-		# If the JSON data is not empty, deserialize it and restore the node settings
-		if json_data:
-			node_settings = json.loads(json_data)
-			for node_name, node_data in node_settings.items():
-				node = bpy.context.scene.node_tree.nodes.get(node_name)
-				if isinstance(node, bpy.types.CompositorNodeOutputFile):
-					node.base_path = node_data.get("base_path", node.base_path)
-					file_slots_data = node_data.get("file_slots", {})
-					for i, slot_data in file_slots_data.items():
-						slot = node.file_slots[int(i)]
-						if slot:
-							slot.path = slot_data.get("path", slot.path)
+	renderState["sequence"] = False
+	
+	# Restore unprocessed output file path and File Output node paths
+	restoreOutputPaths(scene)
 	
 	# Get project name (used by both autosave render and the external log file)
 	projectname = os.path.splitext(os.path.basename(bpy.data.filepath))[0]
 	
 	# Autosave render
-	if (bpy.context.preferences.addons['VF_autosaveRender'].preferences.enable_autosave_render) and bpy.data.filepath:
+	if (prefs.enable_autosave_render) and bpy.data.filepath:
 		
 		# Save original file format settings
 		original_format = scene.render.image_settings.file_format
@@ -394,10 +1033,10 @@ def autosave_render_end(scene):
 		original_colordepth = scene.render.image_settings.color_depth
 		
 		# Set up render output formatting with override
-		if bpy.context.preferences.addons['VF_autosaveRender'].preferences.file_format_override:
-			file_format = bpy.context.preferences.addons['VF_autosaveRender'].preferences.file_format_global
+		if prefs.file_format_override:
+			file_format = prefs.file_format_global
 		else:
-			file_format = bpy.context.scene.autosave_render_settings.file_format
+			file_format = settings.file_format
 		
 		if file_format == 'SCENE':
 			if original_format not in IMAGE_FORMATS:
@@ -412,10 +1051,10 @@ def autosave_render_end(scene):
 		extension = scene.render.file_extension
 		
 		# Get location variable with override and project path replacement
-		if bpy.context.preferences.addons['VF_autosaveRender'].preferences.file_location_override:
-			filepath = bpy.context.preferences.addons['VF_autosaveRender'].preferences.file_location_global
+		if prefs.file_location_override:
+			filepath = prefs.file_location_global
 		else:
-			filepath = bpy.context.scene.autosave_render_settings.file_location
+			filepath = settings.file_location
 		
 		# If the file path contains one or fewer characters, replace it with the project path
 		if len(filepath) <= 1:
@@ -430,31 +1069,32 @@ def autosave_render_end(scene):
 		serialUsed = False
 		serialNumber = -1
 		if '{serial}' in filepath:
-			if bpy.context.preferences.addons['VF_autosaveRender'].preferences.file_location_override:
-				serialNumber = bpy.context.preferences.addons['VF_autosaveRender'].preferences.file_serial_global
+			if prefs.file_location_override:
+				serialNumber = prefs.file_serial_global
 				serialUsedGlobal = True
 			else:
-				serialNumber = bpy.context.scene.autosave_render_settings.file_serial
+				serialNumber = settings.file_serial
 				serialUsed = True
 		
 		# Replace global variables in the output path string
-		filepath = replaceVariables(filepath, rendertime=render_time, serial=serialNumber)
+		filepath = replaceVariables(filepath, rendertime=render_time, serial=serialNumber, snapshot=renderSnapshot)
 		
 		# Create the project subfolder if it doesn't already exist (otherwise subsequent operations will fail)
 		if not os.path.exists(filepath):
 			os.makedirs(filepath)
 		
 		# Get file name type with override
-		if bpy.context.preferences.addons['VF_autosaveRender'].preferences.file_name_override:
-			file_name_type = bpy.context.preferences.addons['VF_autosaveRender'].preferences.file_name_type_global
+		if prefs.file_name_override:
+			file_name_type = prefs.file_name_type_global
 		else:
-			file_name_type = bpy.context.scene.autosave_render_settings.file_name_type
+			file_name_type = settings.file_name_type
 		
 		# Create the output file name string
 		if file_name_type == 'SERIAL':
 			# Generate dynamic serial number
 			# Finds all of the image files that start with projectname in the selected directory
-			files = [f for f in os.listdir(filepath) if f.startswith(projectname) and f.lower().endswith(IMAGE_EXTENSIONS)]
+			with profile('serial folder scan'):
+				files = [f for f in os.listdir(filepath) if f.startswith(projectname) and f.lower().endswith(IMAGE_EXTENSIONS)]
 			
 			# Searches the file collection and returns the next highest number as a 4 digit string
 			def save_number_from_files(files):
@@ -476,27 +1116,27 @@ def autosave_render_end(scene):
 			filename = '{project} {engine} {duration}'
 		else:
 			# Load custom file name with override
-			if bpy.context.preferences.addons['VF_autosaveRender'].preferences.file_name_override:
-				filename = bpy.context.preferences.addons['VF_autosaveRender'].preferences.file_name_custom_global
+			if prefs.file_name_override:
+				filename = prefs.file_name_custom_global
 			else:
-				filename = bpy.context.scene.autosave_render_settings.file_name_custom
+				filename = settings.file_name_custom
 		
 		if '{serial}' in filename:
-			if bpy.context.preferences.addons['VF_autosaveRender'].preferences.file_location_override:
-				serialNumber = bpy.context.preferences.addons['VF_autosaveRender'].preferences.file_serial_global
+			if prefs.file_location_override:
+				serialNumber = prefs.file_serial_global
 				serialUsedGlobal = True
 			else:
-				serialNumber = bpy.context.scene.autosave_render_settings.file_serial
+				serialNumber = settings.file_serial
 				serialUsed = True
 		
 		# Replace global variables in the output name string
-		filename = replaceVariables(filename, rendertime=render_time, serial=serialNumber)
+		filename = replaceVariables(filename, rendertime=render_time, serial=serialNumber, snapshot=renderSnapshot)
 		
 		# Finish local and global serial number updates
 		if serialUsedGlobal:
 			bpy.context.preferences.addons['VF_autosaveRender'].preferences.file_serial_global += 1
 		if serialUsed:
-			bpy.context.scene.autosave_render_settings.file_serial += 1
+			scene.autosave_render_settings.file_serial += 1
 		
 		# Combine file path and file name using system separator, add extension
 		filepath = os.path.join(filepath, filename) + extension
@@ -508,7 +1148,8 @@ def autosave_render_end(scene):
 			return {'CANCELLED'}
 		
 		# Please note that multilayer EXR files are currently unsupported in the Python API - https://developer.blender.org/T71087
-		image.save_render(filepath, scene=None) # Consider using bpy.context.scene if different compression settings are desired per-scene
+		with profile('image.save_render'):
+			image.save_render(filepath, scene=None) # Consider using bpy.context.scene if different compression settings are desired per-scene
 		
 		# Restore original user settings for render output
 		scene.render.image_settings.file_format = original_format
@@ -516,163 +1157,279 @@ def autosave_render_end(scene):
 		scene.render.image_settings.color_depth = original_colordepth
 	
 	# Render complete notifications, only if the time spent rendering exceeds the minimum time defined in the preferences
-	if render_time > float(bpy.context.preferences.addons['VF_autosaveRender'].preferences.minimum_time):
-		if bpy.context.preferences.addons['VF_autosaveRender'].preferences.email_enable:
+	if render_time > float(prefs.minimum_time):
+		if prefs.email_enable:
 			# Subject line variable replacement
 			subject = replaceVariables(
-				bpy.context.preferences.addons['VF_autosaveRender'].preferences.email_subject,
+				prefs.email_subject,
 				rendertime=render_time,
-				serial=bpy.context.scene.autosave_render_settings.output_file_serial
+				serial=settings.output_file_serial,
+				snapshot=renderSnapshot
 				)
 			# Body text variable replacement
 			message = replaceVariables(
-				bpy.context.preferences.addons['VF_autosaveRender'].preferences.email_message,
+				prefs.email_message,
 				rendertime=render_time,
-				serial=bpy.context.scene.autosave_render_settings.output_file_serial
+				serial=settings.output_file_serial,
+				snapshot=renderSnapshot
 				)
 			send_email(subject, message)
 		
-		if bpy.context.preferences.addons['VF_autosaveRender'].preferences.pushover_enable and len(bpy.context.preferences.addons['VF_autosaveRender'].preferences.pushover_key) == 30 and len(bpy.context.preferences.addons['VF_autosaveRender'].preferences.pushover_app) == 30:
+		if prefs.pushover_enable and len(prefs.pushover_key) == 30 and len(prefs.pushover_app) == 30:
 			subject = replaceVariables(
-				bpy.context.preferences.addons['VF_autosaveRender'].preferences.pushover_subject,
+				prefs.pushover_subject,
 				rendertime=render_time,
-				serial=bpy.context.scene.autosave_render_settings.output_file_serial
+				serial=settings.output_file_serial,
+				snapshot=renderSnapshot
 				)
 			message = replaceVariables(
-				bpy.context.preferences.addons['VF_autosaveRender'].preferences.pushover_message,
+				prefs.pushover_message,
 				rendertime=render_time,
-				serial=bpy.context.scene.autosave_render_settings.output_file_serial
+				serial=settings.output_file_serial,
+				snapshot=renderSnapshot
 				)
 			send_pushover(subject, message)
 		
 		# MacOS Siri text-to-speech announcement
-		# Re-check Say location just to be extra-sure (otherwise this is only checked when the add-on is first enable)
-		bpy.context.preferences.addons[__name__].preferences.check_macos_say_location()
-		if bpy.context.preferences.addons['VF_autosaveRender'].preferences.macos_say_exists and bpy.context.preferences.addons['VF_autosaveRender'].preferences.macos_say_enable:
+		# Validate the Say location before use (cached after the first check)
+		if prefs.macos_say_enable:
+			checkExternalTools(ffmpeg=False, say=True)
+			prefs.macos_say_exists = bpy.context.preferences.addons['VF_autosaveRender'].preferences.macos_say_exists
+		if prefs.macos_say_exists and prefs.macos_say_enable:
 			message = replaceVariables(
-				bpy.context.preferences.addons['VF_autosaveRender'].preferences.macos_say_message,
+				prefs.macos_say_message,
 				rendertime=render_time,
-				serial=bpy.context.scene.autosave_render_settings.output_file_serial
+				serial=settings.output_file_serial,
+				snapshot=renderSnapshot
 				)
-			os.system('say "' + message + '"')
+			with profile('say'):
+				os.system('say "' + message + '"')
 	
 	# Save external log file
-	if bpy.context.preferences.addons['VF_autosaveRender'].preferences.external_render_time:
-		# Log file settings
-		logname = bpy.context.preferences.addons['VF_autosaveRender'].preferences.external_log_name
-		logname = logname.replace("{project}", projectname)
-		logpath = os.path.join(os.path.dirname(bpy.data.filepath), logname) # Limited to locations local to the project file
-		logtitle = 'Total Render Time: '
-		logtime = 0.00
-		
-		# Get previous time spent rendering, if log file exists, and convert formatted string into seconds
-		if os.path.exists(logpath):
-			with open(logpath) as filein:
-				logtime = filein.read().replace(logtitle, '')
-				logtime = readableToSeconds(logtime)
-		# Create log file directory location if it doesn't exist
-		elif not os.path.exists(os.path.dirname(logpath)): # Safety net just in case a folder was included in the file name entry
-			os.makedirs(os.path.dirname(logpath))
-		
-		# Add the latest render time
-		logtime += float(render_time)
-		
-		# Convert seconds into formatted string
-		logtime = secondsToReadable(logtime)
-		
-		# Write log file
-		with open(logpath, 'w') as fileout:
-			fileout.write(logtitle + logtime)
+	if prefs.external_render_time:
+		with profile('external log'):
+			# Log file settings
+			logname = prefs.external_log_name
+			logname = logname.replace("{project}", projectname)
+			logpath = os.path.join(os.path.dirname(bpy.data.filepath), logname) # Limited to locations local to the project file
+			logtitle = 'Total Render Time: '
+			logtime = 0.00
+			
+			# Get previous time spent rendering, if log file exists, and convert formatted string into seconds
+			if os.path.exists(logpath):
+				with open(logpath) as filein:
+					logtime = filein.read().replace(logtitle, '')
+					logtime = readableToSeconds(logtime)
+			# Create log file directory location if it doesn't exist
+			elif not os.path.exists(os.path.dirname(logpath)): # Safety net just in case a folder was included in the file name entry
+				os.makedirs(os.path.dirname(logpath))
+			
+			# Add the latest render time
+			logtime += float(render_time)
+			
+			# Convert seconds into formatted string
+			logtime = secondsToReadable(logtime)
+			
+			# Write log file
+			with open(logpath, 'w') as fileout:
+				fileout.write(logtitle + logtime)
 	
 	return {'FINISHED'}
 
 
 
 ###########################################################################
-# Variable replacement function
-# •Prepopulate data that requires more logic
-# •Replace all variables
-# 	•Replaces {duration}{rtime}{rH}{rM}{rS} only if valid 0.0+ float is provided
-# 	•Replaces {serial} only if valid 0+ integer is provided
+# Variable template functions
+# •Alternative variable names
+# •Compile template strings into literal and variable tokens (cached per source string)
+# •Expand compiled templates in a single pass
+# •Precompile project and preference templates (also compiled by property update callbacks when edited)
 
-def replaceVariables(string, rendertime=-1.0, serial=-1):
-	# Get scene from context
-	scene = bpy.context.scene
-	
-	# Get render engine feature sets
-	if bpy.context.engine == 'BLENDER_WORKBENCH':
-		renderEngine = 'Workbench'
-		renderDevice = 'GPU'
-		renderSamples = scene.display.render_aa
-		renderFeatures = scene.display.shading.light.title().replace("Matcap", "MatCap") + '+' + scene.display.shading.color_type.title()
-
-	elif bpy.context.engine == 'BLENDER_EEVEE':
-		renderEngine = 'Eevee'
-		renderDevice = 'GPU'
-		renderSamples = str(scene.eevee.taa_render_samples) + '+' + str(scene.eevee.sss_samples) + '+' + str(scene.eevee.volumetric_samples)
-		renderFeaturesArray = []
-		if scene.eevee.use_gtao:
-			renderFeaturesArray.append('AO')
-		if scene.eevee.use_bloom:
-			renderFeaturesArray.append('Bloom')
-		if scene.eevee.use_ssr:
-			renderFeaturesArray.append('SSR')
-		if scene.eevee.use_motion_blur:
-			renderFeaturesArray.append('MB' + str(scene.eevee.motion_blur_steps))
-		renderFeatures = 'None' if len(renderFeaturesArray) == 0 else '+'.join(renderFeaturesArray)
-
-	elif bpy.context.engine == 'CYCLES':
-		renderEngine = 'Cycles'
-		renderDevice = scene.cycles.device
-		# Add compute device type if GPU is enabled
-		# if renderDevice == "GPU":
-			# renderDevice += '_' + bpy.context.preferences.addons["cycles"].preferences.compute_device_type
-		renderSamples = str(round(scene.cycles.adaptive_threshold, 4)) + '+' + str(scene.cycles.samples) + '+' + str(scene.cycles.adaptive_min_samples)
-		renderFeatures = str(scene.cycles.max_bounces) + '+' + str(scene.cycles.diffuse_bounces) + '+' + str(scene.cycles.glossy_bounces) + '+' + str(scene.cycles.transmission_bounces) + '+' + str(scene.cycles.volume_bounces) + '+' + str(scene.cycles.transparent_max_bounces)
-
-	elif bpy.context.engine == 'RPR':
-		renderEngine = 'ProRender'
-		# Compile array of enabled devices
-		renderDevicesArray = []
-		if bpy.context.preferences.addons["rprblender"].preferences.settings.final_devices.cpu_state:
-			renderDevicesArray.append('CPU')
-		for gpu in bpy.context.preferences.addons["rprblender"].preferences.settings.final_devices.available_gpu_states:
-			if gpu:
-				renderDevicesArray.append('GPU')
-		renderDevice = 'None' if len(renderDevicesArray) == 0 else '+'.join(renderDevicesArray)
-		renderSamples = str(scene.rpr.limits.min_samples) + '+' + str(scene.rpr.limits.max_samples) + '+' + str(round(scene.rpr.limits.noise_threshold, 4))
-		renderFeatures = str(scene.rpr.max_ray_depth) + '+' + str(scene.rpr.diffuse_depth) + '+' + str(scene.rpr.glossy_depth) + '+' + str(scene.rpr.refraction_depth) + '+' + str(scene.rpr.glossy_refraction_depth) + '+' + str(scene.rpr.shadow_depth)
-
-	elif bpy.context.engine == 'LUXCORE':
-		renderEngine = 'LuxCore'
-		renderDevice = 'CPU' if scene.luxcore.config.device == 'CPU' else 'GPU'
-		# Samples returns the halt conditions for time, samples, and/or noise threshold
-		renderSamples = ''
-		if scene.luxcore.halt.use_time:
-			renderSamples += str(scene.luxcore.halt.time) + 's'
-		if scene.luxcore.halt.use_samples:
-			if len(renderSamples) > 0:
-				renderSamples += '+'
-			renderSamples += str(scene.luxcore.halt.samples)
-		if scene.luxcore.halt.use_noise_thresh:
-			if len(renderSamples) > 0:
-				renderSamples += '+'
-			renderSamples += str(scene.luxcore.halt.noise_thresh) + '+' + str(scene.luxcore.halt.noise_thresh_warmup) + '+' + str(scene.luxcore.halt.noise_thresh_step)
-		# Features include the number of paths or bounces (depending on engine selected) and denoising if enabled
-		if scene.luxcore.config.engine == 'PATH':
-			renderEngine += '-Path'
-			renderFeatures = str(scene.luxcore.config.path.depth_total) + '+' + str(scene.luxcore.config.path.depth_diffuse) + '+' + str(scene.luxcore.config.path.depth_glossy) + '+' + str(scene.luxcore.config.path.depth_specular)
-		else:
-			renderEngine += '-Bidir'
-			renderFeatures = str(scene.luxcore.config.bidir_path_maxdepth) + '+' + str(scene.luxcore.config.bidir_light_maxdepth)
-		if scene.luxcore.denoiser.enabled:
-			renderFeatures += '+' + str(scene.luxcore.denoiser.type)
+# Alternative variable names (backwards compatibility may be removed at a later date)
+variableAliases = {
+	"viewtransform": "space",
+	"colorspace": "space",
+	"renderengine": "engine",
+	"rendertime": "duration",
+	"version": "blender",
+	"year": "y",
+	"month": "m",
+	"day": "d",
+	"hour": "H",
+	"minute": "M",
+	"second": "S",
+	"index": "batch"}
+
+# Compiled template: tuple of (preceding literal, variable name, original token) entries, trailing literal, the set of variable names used, and any unrecognised variables
+CompiledTemplate = namedtuple('CompiledTemplate', ['tokens', 'tail', 'variables', 'unknown'])
+
+# Compiled templates keyed by source string
+templateCache = {}
+TEMPLATE_CACHE_LIMIT = 1024
+
+def compileTemplate(string):
+	template = templateCache.get(string)
+	if template is None:
+		tokens = []
+		variables = set()
+		unknown = []
+		literal = ''
+		position = 0
+		for match in finditer(r'\{(\w+)\}', string):
+			name = variableAliases.get(match.group(1), match.group(1))
+			# Unknown variables are kept as literal text
+			if name in variableResolvers:
+				tokens.append((literal + string[position:match.start()], name, match.group(0)))
+				variables.add(name)
+				literal = ''
+			else:
+				literal += string[position:match.end()]
+				if match.group(0) not in unknown:
+					unknown.append(match.group(0))
+			position = match.end()
+		template = CompiledTemplate(tuple(tokens), literal + string[position:], frozenset(variables), tuple(unknown))
+		# Keep the cache from growing indefinitely when strings are generated dynamically
+		if len(templateCache) >= TEMPLATE_CACHE_LIMIT:
+			templateCache.clear()
+		templateCache[string] = template
+	return template
+
+def expandTemplate(template, values):
+	parts = []
+	for literal, name, original in template.tokens:
+		parts.append(literal)
+		# Variables without a value (such as render time before rendering completes) are left unchanged
+		value = values.get(name)
+		parts.append(original if value is None else value)
+	parts.append(template.tail)
+	return ''.join(parts)
+
+# FFmpeg command placeholders (valid only in the custom FFmpeg command)
+FFMPEG_COMMAND_VARIABLES = ("{fps}", "{input}", "{output}")
+
+# Template properties in the project settings and add-on preferences
+TEMPLATE_SETTINGS = ("file_location", "file_name_custom", "autosave_video_prores_location", "autosave_video_mp4_location", "autosave_video_custom_command", "autosave_video_custom_location")
+TEMPLATE_PREFERENCES = ("file_location_global", "file_name_custom_global", "email_subject", "email_message", "pushover_subject", "pushover_message", "macos_say_message")
+
+def precompileTemplates():
+	for scene in bpy.data.scenes:
+		compileTemplate(scene.render.filepath)
+		for name in TEMPLATE_SETTINGS:
+			compileTemplate(getattr(scene.autosave_render_settings, name))
+	for name in TEMPLATE_PREFERENCES:
+		compileTemplate(getattr(bpy.context.preferences.addons['VF_autosaveRender'].preferences, name))
+
+
+
+###########################################################################
+# Variable resolver functions
+# •Render engine resolver registry (engine, device, samples, features)
+# •Active selection data (item, material, node)
+# •System data (cached for the lifetime of the Blender process)
+# •Per-call shared data (colour management source, timestamp, render time)
+# •Variable resolver list, each function is only called when the variable is used in a template
+
+# Render engine resolvers return (engine, device, samples, features) strings for the supplied scene
+def renderEngineWorkbench(scene):
+	renderEngine = 'Workbench'
+	renderDevice = 'GPU'
+	renderSamples = scene.display.render_aa
+	renderFeatures = scene.display.shading.light.title().replace("Matcap", "MatCap") + '+' + scene.display.shading.color_type.title()
+	return renderEngine, renderDevice, renderSamples, renderFeatures
+
+def renderEngineEevee(scene):
+	renderEngine = 'Eevee'
+	renderDevice = 'GPU'
+	renderSamples = str(scene.eevee.taa_render_samples) + '+' + str(scene.eevee.sss_samples) + '+' + str(scene.eevee.volumetric_samples)
+	renderFeaturesArray = []
+	if scene.eevee.use_gtao:
+		renderFeaturesArray.append('AO')
+	if scene.eevee.use_bloom:
+		renderFeaturesArray.append('Bloom')
+	if scene.eevee.use_ssr:
+		renderFeaturesArray.append('SSR')
+	if scene.eevee.use_motion_blur:
+		renderFeaturesArray.append('MB' + str(scene.eevee.motion_blur_steps))
+	renderFeatures = 'None' if len(renderFeaturesArray) == 0 else '+'.join(renderFeaturesArray)
+	return renderEngine, renderDevice, renderSamples, renderFeatures
 
+def renderEngineCycles(scene):
+	renderEngine = 'Cycles'
+	renderDevice = scene.cycles.device
+	# Add compute device type if GPU is enabled
+	# if renderDevice == "GPU":
+		# renderDevice += '_' + bpy.context.preferences.addons["cycles"].preferences.compute_device_type
+	renderSamples = str(round(scene.cycles.adaptive_threshold, 4)) + '+' + str(scene.cycles.samples) + '+' + str(scene.cycles.adaptive_min_samples)
+	renderFeatures = str(scene.cycles.max_bounces) + '+' + str(scene.cycles.diffuse_bounces) + '+' + str(scene.cycles.glossy_bounces) + '+' + str(scene.cycles.transmission_bounces) + '+' + str(scene.cycles.volume_bounces) + '+' + str(scene.cycles.transparent_max_bounces)
+	return renderEngine, renderDevice, renderSamples, renderFeatures
+
+def renderEngineProRender(scene):
+	renderEngine = 'ProRender'
+	# Compile array of enabled devices
+	renderDevicesArray = []
+	finalDevices = bpy.context.preferences.addons["rprblender"].preferences.settings.final_devices
+	if finalDevices.cpu_state:
+		renderDevicesArray.append('CPU')
+	for gpu in finalDevices.available_gpu_states:
+		if gpu:
+			renderDevicesArray.append('GPU')
+	renderDevice = 'None' if len(renderDevicesArray) == 0 else '+'.join(renderDevicesArray)
+	renderSamples = str(scene.rpr.limits.min_samples) + '+' + str(scene.rpr.limits.max_samples) + '+' + str(round(scene.rpr.limits.noise_threshold, 4))
+	renderFeatures = str(scene.rpr.max_ray_depth) + '+' + str(scene.rpr.diffuse_depth) + '+' + str(scene.rpr.glossy_depth) + '+' + str(scene.rpr.refraction_depth) + '+' + str(scene.rpr.glossy_refraction_depth) + '+' + str(scene.rpr.shadow_depth)
+	return renderEngine, renderDevice, renderSamples, renderFeatures
+
+def renderEngineLuxCore(scene):
+	renderEngine = 'LuxCore'
+	renderDevice = 'CPU' if scene.luxcore.config.device == 'CPU' else 'GPU'
+	# Samples returns the halt conditions for time, samples, and/or noise threshold
+	renderSamples = ''
+	if scene.luxcore.halt.use_time:
+		renderSamples += str(scene.luxcore.halt.time) + 's'
+	if scene.luxcore.halt.use_samples:
+		if len(renderSamples) > 0:
+			renderSamples += '+'
+		renderSamples += str(scene.luxcore.halt.samples)
+	if scene.luxcore.halt.use_noise_thresh:
+		if len(renderSamples) > 0:
+			renderSamples += '+'
+		renderSamples += str(scene.luxcore.halt.noise_thresh) + '+' + str(scene.luxcore.halt.noise_thresh_warmup) + '+' + str(scene.luxcore.halt.noise_thresh_step)
+	# Features include the number of paths or bounces (depending on engine selected) and denoising if enabled
+	if scene.luxcore.config.engine == 'PATH':
+		renderEngine += '-Path'
+		renderFeatures = str(scene.luxcore.config.path.depth_total) + '+' + str(scene.luxcore.config.path.depth_diffuse) + '+' + str(scene.luxcore.config.path.depth_glossy) + '+' + str(scene.luxcore.config.path.depth_specular)
 	else:
-		renderEngine = bpy.context.engine
-		renderDevice = 'unknown'
-		renderSamples = 'unknown'
-		renderFeatures = 'unknown'
+		renderEngine += '-Bidir'
+		renderFeatures = str(scene.luxcore.config.bidir_path_maxdepth) + '+' + str(scene.luxcore.config.bidir_light_maxdepth)
+	if scene.luxcore.denoiser.enabled:
+		renderFeatures += '+' + str(scene.luxcore.denoiser.type)
+	return renderEngine, renderDevice, renderSamples, renderFeatures
+
+# Render engine resolvers keyed by bpy.context.engine identifier
+renderEngineResolvers = {
+	'BLENDER_WORKBENCH': renderEngineWorkbench,
+	'BLENDER_EEVEE': renderEngineEevee,
+	'CYCLES': renderEngineCycles,
+	'RPR': renderEngineProRender,
+	'LUXCORE': renderEngineLuxCore}
+
+# Public hooks allowing other add-ons to supply variables for their own render engines
+# Example: VF_autosaveRender.registerRenderEngineResolver('MY_ENGINE', lambda scene: ('MyEngine', 'GPU', str(scene.my_engine.samples), 'None'))
+def registerRenderEngineResolver(engine, resolver):
+	renderEngineResolvers[engine] = resolver
+
+def unregisterRenderEngineResolver(engine):
+	renderEngineResolvers.pop(engine, None)
+
+def getRenderEngineData():
+	# Engines without a registered resolver only report their internal identifier
+	resolver = renderEngineResolvers.get(bpy.context.engine)
+	if resolver is None:
+		return bpy.context.engine, 'unknown', 'unknown', 'unknown'
+	return resolver(bpy.context.scene)
+
+def getProjectSelection():
+	# Get scene from context
+	scene = bpy.context.scene
 	
 	# Get conditional project variables Item > Material > Node
 	projectItem = projectMaterial = projectNode = 'None'
@@ -699,77 +1456,226 @@ def replaceVariables(string, rendertime=-1.0, serial=-1):
 	# Remove file extension from image node names (this could be unhelpful when comparing renders with .psd versus .jpg texture sources)
 	projectNode = sub(r'\.\w{3,4}$', '', projectNode)
 	
-	# Using "replace" instead of "format" because format fails ungracefully when an exact match isn't found
+	return projectItem, projectMaterial, projectNode
+
+# System values never change while Blender is running, so they're only gathered on first use (platform calls can read files or spawn processes on some systems)
+systemVariables = {}
+
+def getSystemVariables():
+	if not systemVariables:
+		system = platform.system()
+		systemVariables.update({
+			"host": platform.node().split('.')[0],
+			"processor": platform.processor(), # Alternate: platform.machine() provides the same information in many cases
+			"platform": platform.platform(),
+			"system": system.replace("Darwin", "macOS"), # Alternate: {os}
+			"release": platform.mac_ver()[0] if system == "Darwin" else platform.release(), # Alternate: {system}
+			"python": platform.python_version(),
+			"blender": bpy.app.version_string + '-' + bpy.app.version_cycle})
+	return systemVariables
+
+# Scene statistics require walking the evaluated dependency graph, so they're gathered on first use and kept until the next depsgraph update
+sceneStatistics = {}
+
+def getSceneStatistics():
+	if not sceneStatistics:
+		polycount = 0
+		objects = 0
+		lights = 0
+		meshes = {}
+		try:
+			depsgraph = bpy.context.evaluated_depsgraph_get()
+			# Object instances include particle and geometry node instances, counting each evaluated mesh once
+			for instance in depsgraph.object_instances:
+				obj = instance.object
+				objects += 1
+				if obj.type == 'MESH':
+					key = obj.data.as_pointer()
+					if key not in meshes:
+						meshes[key] = len(obj.data.polygons)
+					polycount += meshes[key]
+				elif obj.type == 'LIGHT':
+					lights += 1
+			sceneStatistics.update({"polycount": str(polycount), "objects": str(objects), "lights": str(lights)})
+		except Exception as exc:
+			print(str(exc) + " | Error in VF Autosave Render: failed to read scene statistics from the dependency graph")
+		# Memory usage is only available from the statistics string (example: "Memory: 38.5 MiB")
+		try:
+			memory = search(r'Memory:\s*([\d.,]+)\s*(\w+)', bpy.context.scene.statistics(bpy.context.view_layer))
+			sceneStatistics["memory"] = memory.group(1) + memory.group(2) if memory else None
+		except Exception as exc:
+			print(str(exc) + " | Error in VF Autosave Render: failed to read scene memory usage")
+	return sceneStatistics
+
+@persistent
+def autosave_render_statistics_clear(scene, depsgraph=None):
+	sceneStatistics.clear()
+
+# Shared data is computed at most once per replaceVariables call and stored in the per-call cache
+def cachedValue(cache, key, function):
+	if key not in cache:
+		cache[key] = function()
+	return cache[key]
+
+def renderEngineData(cache):
+	return cachedValue(cache, "_engine", getRenderEngineData)
+
+def projectSelection(cache):
+	return cachedValue(cache, "_selection", getProjectSelection)
+
+def imageSettings(cache):
+	return cachedValue(cache, "_image", lambda: bpy.context.scene.render.image_settings if bpy.context.scene.render.image_settings.color_management == "OVERRIDE" else bpy.context.scene)
+
+def timestamp(cache):
+	# Single timestamp used for all date and time variables
+	return cachedValue(cache, "_now", datetime.datetime.now)
+
+def renderTimeStrings(cache):
+	# Only enabled if a value is supplied
+	if cache["_rendertime"] < 0.0:
+		return None
+	return cachedValue(cache, "_rtime", lambda: secondsToStrings(cache["_rendertime"]))
+
+def renderTimeString(cache, index):
+	strings = renderTimeStrings(cache)
+	return None if strings is None else strings[index]
+
+# Returning None leaves the variable unchanged in the output string
+variableResolvers = {
 	# Project variables
-	string = string.replace("{project}", os.path.splitext(os.path.basename(bpy.data.filepath))[0])
-	string = string.replace("{scene}", scene.name)
-	string = string.replace("{viewlayer}", bpy.context.view_layer.name)
-	string = string.replace("{collection}", scene.autosave_render_settings.batch_collection_name if len(scene.autosave_render_settings.batch_collection_name) > 0 else bpy.context.collection.name)
-	string = string.replace("{camera}", scene.camera.name)
-	string = string.replace("{item}", projectItem)
-	string = string.replace("{material}", projectMaterial)
-	string = string.replace("{node}", projectNode)
-	
+	"project": lambda cache: os.path.splitext(os.path.basename(bpy.data.filepath))[0],
+	"scene": lambda cache: bpy.context.scene.name,
+	"viewlayer": lambda cache: bpy.context.view_layer.name,
+	"collection": lambda cache: bpy.context.scene.autosave_render_settings.batch_collection_name if len(bpy.context.scene.autosave_render_settings.batch_collection_name) > 0 else bpy.context.collection.name,
+	"camera": lambda cache: bpy.context.scene.camera.name,
+	"item": lambda cache: projectSelection(cache)[0],
+	"material": lambda cache: projectSelection(cache)[1],
+	"node": lambda cache: projectSelection(cache)[2],
 	# Image variables
-	sceneOverride = scene.render.image_settings if bpy.context.scene.render.image_settings.color_management == "OVERRIDE" else scene
-	string = string.replace("{display}", sceneOverride.display_settings.display_device.replace(" ", "").replace(".", ""))
-	string = string.replace("{viewtransform}", "{colorspace}") # Alternative variable (backwards compatibility may be removed at a later date)
-	string = string.replace("{colorspace}", "{space}") # Alternative variable (backwards compatibility may be removed at a later date)
-	string = string.replace("{space}", sceneOverride.view_settings.view_transform.replace(" ", ""))
-	string = string.replace("{look}", sceneOverride.view_settings.look.replace(" ", "").replace("AgX-", "").replace("FalseColor-", ""))
-	string = string.replace("{exposure}", str(sceneOverride.view_settings.exposure))
-	string = string.replace("{gamma}", str(sceneOverride.view_settings.gamma))
-	string = string.replace("{curves}", "Curves" if sceneOverride.view_settings.use_curve_mapping else "None")
-	string = string.replace("{compositing}", "Compositing" if scene.use_nodes else "None")
-	
+	"display": lambda cache: imageSettings(cache).display_settings.display_device.replace(" ", "").replace(".", ""),
+	"space": lambda cache: imageSettings(cache).view_settings.view_transform.replace(" ", ""),
+	"look": lambda cache: imageSettings(cache).view_settings.look.replace(" ", "").replace("AgX-", "").replace("FalseColor-", ""),
+	"exposure": lambda cache: str(imageSettings(cache).view_settings.exposure),
+	"gamma": lambda cache: str(imageSettings(cache).view_settings.gamma),
+	"curves": lambda cache: "Curves" if imageSettings(cache).view_settings.use_curve_mapping else "None",
+	"compositing": lambda cache: "Compositing" if bpy.context.scene.use_nodes else "None",
 	# Rendering variables
-	string = string.replace("{renderengine}", "{engine}") # Alternative variable (backwards compatibility may be removed at a later date)
-	string = string.replace("{engine}", renderEngine)
-	string = string.replace("{device}", renderDevice)
-	string = string.replace("{samples}", renderSamples)
-	string = string.replace("{features}", renderFeatures)
-	if rendertime >= 0.0: # Only enabled if a value is supplied
-		string = string.replace("{rendertime}", "{duration}") # Alternative variable (backwards compatibility may be removed at a later date)
-		string = string.replace("{duration}", str(rendertime) + 's')
-		rH, rM, rS = secondsToStrings(rendertime)
-		string = string.replace("{rtime}", rH + '-' + rM + '-' + rS)
-		string = string.replace("{rH}", rH)
-		string = string.replace("{rM}", rM)
-		string = string.replace("{rS}", rS)
-	
+	"engine": lambda cache: renderEngineData(cache)[0],
+	"device": lambda cache: renderEngineData(cache)[1],
+	"samples": lambda cache: renderEngineData(cache)[2],
+	"features": lambda cache: renderEngineData(cache)[3],
+	"duration": lambda cache: None if cache["_rendertime"] < 0.0 else str(cache["_rendertime"]) + 's',
+	"rtime": lambda cache: None if renderTimeStrings(cache) is None else '-'.join(renderTimeStrings(cache)),
+	"rH": lambda cache: renderTimeString(cache, 0),
+	"rM": lambda cache: renderTimeString(cache, 1),
+	"rS": lambda cache: renderTimeString(cache, 2),
 	# System variables
-	string = string.replace("{host}", platform.node().split('.')[0])
-	string = string.replace("{processor}", platform.processor()) # Alternate: platform.machine() provides the same information in many cases
-	string = string.replace("{platform}", platform.platform())
-	string = string.replace("{system}", platform.system().replace("Darwin", "macOS")) # Alternate: {os}
-	string = string.replace("{release}", platform.mac_ver()[0] if platform.system() == "Darwin" else platform.release()) # Alternate: {system}
-	string = string.replace("{python}", platform.python_version())
-	string = string.replace("{version}", "{blender}") # Alternative variable (backwards compatibility may be removed at a later date)
-	string = string.replace("{blender}", bpy.app.version_string + '-' + bpy.app.version_cycle)
-	
+	"host": lambda cache: getSystemVariables()["host"],
+	"processor": lambda cache: getSystemVariables()["processor"],
+	"platform": lambda cache: getSystemVariables()["platform"],
+	"system": lambda cache: getSystemVariables()["system"],
+	"release": lambda cache: getSystemVariables()["release"],
+	"python": lambda cache: getSystemVariables()["python"],
+	"blender": lambda cache: getSystemVariables()["blender"],
 	# Identifier variables
-	string = string.replace("{date}", datetime.datetime.now().strftime('%Y-%m-%d'))
-	string = string.replace("{year}", "{y}") # Alternative variable
-	string = string.replace("{y}", datetime.datetime.now().strftime('%Y'))
-	string = string.replace("{month}", "{m}") # Alternative variable
-	string = string.replace("{m}", datetime.datetime.now().strftime('%m'))
-	string = string.replace("{day}", "{d}") # Alternative variable
-	string = string.replace("{d}", datetime.datetime.now().strftime('%d'))
-	string = string.replace("{time}", datetime.datetime.now().strftime('%H-%M-%S'))
-	string = string.replace("{hour}", "{H}") # Alternative variable
-	string = string.replace("{H}", datetime.datetime.now().strftime('%H'))
-	string = string.replace("{minute}", "{M}") # Alternative variable
-	string = string.replace("{M}", datetime.datetime.now().strftime('%M'))
-	string = string.replace("{second}", "{S}") # Alternative variable
-	string = string.replace("{S}", datetime.datetime.now().strftime('%S'))
-	if serial >= 0: # Only enabled if a value is supplied
-		string = string.replace("{serial}", format(serial, '04'))
-	string = string.replace("{frame}", format(scene.frame_current, '04'))
+	"date": lambda cache: timestamp(cache).strftime('%Y-%m-%d'),
+	"y": lambda cache: timestamp(cache).strftime('%Y'),
+	"m": lambda cache: timestamp(cache).strftime('%m'),
+	"d": lambda cache: timestamp(cache).strftime('%d'),
+	"time": lambda cache: timestamp(cache).strftime('%H-%M-%S'),
+	"H": lambda cache: timestamp(cache).strftime('%H'),
+	"M": lambda cache: timestamp(cache).strftime('%M'),
+	"S": lambda cache: timestamp(cache).strftime('%S'),
+	"serial": lambda cache: None if cache["_serial"] < 0 else format(cache["_serial"], '04'), # Only enabled if a value is supplied
+	"frame": lambda cache: format(bpy.context.scene.frame_current, '04'),
 	# Consider adding hash-mark support for inserting frames: sub(r'#+(?!.*#)', "", absolute_path)
 	# Batch variables
-	string = string.replace("{index}", "{batch}") # Alternative variable (backwards compatibility may be removed at a later date)
-	string = string.replace("{batch}", format(scene.autosave_render_settings.batch_index, '04'))
-	return string
+	"batch": lambda cache: format(bpy.context.scene.autosave_render_settings.batch_index, '04'),
+	# Statistics variables
+	"polycount": lambda cache: getSceneStatistics().get("polycount"),
+	"objects": lambda cache: getSceneStatistics().get("objects"),
+	"lights": lambda cache: getSceneStatistics().get("lights"),
+	"memory": lambda cache: getSceneStatistics().get("memory")}
+
+
+
+###########################################################################
+# Render snapshot functions
+# •Capture project, render engine, and timestamp data once per render
+# 	•All templates expanded during a render share the same snapshot, so paths agree on {date} and {time}
+
+# Variables stored in the render snapshot (date and time variables are derived from the snapshot timestamp)
+SNAPSHOT_VARIABLES = ("project", "scene", "viewlayer", "collection", "camera", "item", "material", "node", "engine", "device", "samples", "features")
+
+# Snapshot of the current (or most recent) render, set in the render start and end handlers
+renderSnapshot = None
+
+def captureRenderSnapshot(now=None):
+	cache = {"_now": now if now else datetime.datetime.now()}
+	for name in SNAPSHOT_VARIABLES:
+		try:
+			cache[name] = variableResolvers[name](cache)
+		except Exception:
+			# Unavailable data is left out so it's resolved (and reported) by any template that actually uses it
+			pass
+	return MappingProxyType(cache)
+
+
+
+###########################################################################
+# Variable replacement functions
+# •Compile the template (cached per source string)
+# •Resolve only the variables used in the template, using the render snapshot where provided
+# 	•Replaces {duration}{rtime}{rH}{rM}{rS} only if valid 0.0+ float is provided
+# 	•Replaces {serial} only if valid 0+ integer is provided
+# •Bulk replacement for frame ranges and/or batch index lists, resolving everything except {frame} and {batch} only once
+
+def resolveVariables(template, rendertime=-1.0, serial=-1, snapshot=None, exclude=()):
+	# Per-call cache shared between resolvers so grouped data is only gathered once, seeded with the render snapshot if provided
+	cache = dict(snapshot) if snapshot else {}
+	cache["_rendertime"] = rendertime
+	cache["_serial"] = serial
+	return {name: cache[name] if name in cache else variableResolvers[name](cache) for name in template.variables if name not in exclude}
+
+@profiled
+def replaceVariables(string, rendertime=-1.0, serial=-1, snapshot=None):
+	# Skip processing entirely if no known variables are used
+	template = compileTemplate(string)
+	if not template.variables:
+		return string
+	
+	return expandTemplate(template, resolveVariables(template, rendertime=rendertime, serial=serial, snapshot=snapshot))
+
+# Variables substituted per item in bulk replacement
+BULK_VARIABLES = ("frame", "batch")
+
+def replaceVariablesBulk(string, frames=None, batches=None, rendertime=-1.0, serial=-1, snapshot=None):
+	# Frames and batch indices default to the current scene values when not supplied
+	frames = [format(frame, '04') for frame in frames] if frames is not None else [format(bpy.context.scene.frame_current, '04')]
+	batches = [format(batch, '04') for batch in batches] if batches is not None else [format(bpy.context.scene.autosave_render_settings.batch_index, '04')]
+	
+	# Resolve all frame-invariant variables once
+	template = compileTemplate(string)
+	values = resolveVariables(template, rendertime=rendertime, serial=serial, snapshot=snapshot, exclude=BULK_VARIABLES)
+	
+	# Collapse resolved variables into literal text, leaving only the per-item variables
+	pieces = []
+	literal = ''
+	for preceding, name, original in template.tokens:
+		literal += preceding
+		if name in BULK_VARIABLES:
+			pieces.append((literal, name))
+			literal = ''
+		else:
+			value = values.get(name)
+			literal += original if value is None else value
+	tail = literal + template.tail
+	
+	# Yield expanded strings for every batch index and frame combination (frames change fastest)
+	for batch in batches:
+		for frame in frames:
+			item = {"frame": frame, "batch": batch}
+			yield ''.join([preceding + item[name] for preceding, name in pieces]) + tail
 
 
 
@@ -800,7 +1706,9 @@ def readableToSeconds(readable):
 
 
 ###########################################################################
-# Copy string to clipboard
+# Variable utility operators
+# •Copy string to clipboard
+# •Refresh cached system variables
 
 class AutosaveRenderCopyToClipboard(bpy.types.Operator):
 	"""Copy variable to the clipboard"""
@@ -821,6 +1729,618 @@ class AutosaveRenderCopyToClipboard(bpy.types.Operator):
 		
 		return {'FINISHED'}
 
+class AutosaveRenderRefreshSystemVariables(bpy.types.Operator):
+	"""Refresh the cached system variables (host, processor, platform, system, release, python, blender)"""
+	bl_label = "Refresh System Variables"
+	bl_idname = "vf.autosave_render_refresh_system_variables"
+	bl_options = {'REGISTER', 'INTERNAL'}
+	
+	def execute(self, context):
+		systemVariables.clear()
+		getSystemVariables()
+		return {'FINISHED'}
+
+
+
+###########################################################################
+# External tool discovery
+# •Resolve FFmpeg and MacOS Say once, caching the path, modification time, and version output
+# •Cached tools are validated with a single file check before use, only searching the system path again when the configured location changes or the file changes
+# •Missing tools are searched for again after a short delay
+# •FFmpeg and MacOS Say are first checked after startup instead of during registration, and background renders only check a tool when a render needs it
+
+ToolEntry = namedtuple('ToolEntry', ['path', 'configured', 'mtime', 'version'])
+
+# Tools keyed by (name, configured location), storing a ToolEntry or the time a missing tool was last searched for
+toolCache = {}
+
+# Seconds before searching for a missing tool again
+TOOL_MISSING_INTERVAL = 30.0
+
+TOOL_VERSION_ARGUMENTS = {
+	"ffmpeg": ["-version"],
+	"say": None}
+
+def findTool(name, configured="", version=False):
+	key = (name, configured)
+	entry = toolCache.get(key)
+	if isinstance(entry, ToolEntry):
+		try:
+			if os.stat(entry.path).st_mtime == entry.mtime:
+				if version and entry.version is None:
+					entry = toolCache[key] = entry._replace(version=toolVersion(name, entry.path))
+				return entry
+		except OSError:
+			pass
+	elif entry is not None and time.monotonic() - entry < TOOL_MISSING_INTERVAL:
+		return None
+	
+	# Search the configured location first, then the system path
+	from shutil import which
+	path = which(configured) if configured else None
+	configuredFound = path is not None
+	if path is None:
+		path = which(name)
+	if path is None:
+		toolCache[key] = time.monotonic()
+		return None
+	entry = toolCache[key] = ToolEntry(path, configuredFound, os.stat(path).st_mtime, toolVersion(name, path) if version else None)
+	return entry
+
+def toolVersion(name, path):
+	arguments = TOOL_VERSION_ARGUMENTS.get(name)
+	if not arguments:
+		return ""
+	import subprocess
+	try:
+		output = subprocess.run([path] + arguments, capture_output=True, text=True, timeout=5).stdout
+		return output.splitlines()[0] if output else ""
+	except Exception as exc:
+		print(str(exc) + " | Error in VF Autosave Render: failed to get " + name + " version")
+		return ""
+
+def checkExternalTools(ffmpeg=True, say=True):
+	prefs = bpy.context.preferences.addons['VF_autosaveRender'].preferences
+	if ffmpeg and prefs.ffmpeg_processing:
+		prefs.check_ffmpeg_location()
+	if say:
+		prefs.check_macos_say_location()
+
+def autosave_render_check_tools():
+	try:
+		checkExternalTools()
+	except Exception as exc:
+		print(str(exc) + " | Error in VF Autosave Render: failed to check external tool locations")
+	# Run once
+	return None
+
+
+
+###########################################################################
+# FFmpeg command functions
+# •Build the image sequence input from the exact frames rendered, instead of matching files in the output folder
+# •Build the commands for each enabled video format as argument lists (no shell quoting required)
+# •Split custom commands into a video filter and output options
+# •Combine multiple outputs into one command, decoding the image sequence once and splitting the frames between outputs
+
+# Options that can't be used with a combined command (additional inputs, stream mapping, or filter graphs)
+FFMPEG_UNCOMBINABLE = ('-i', '-map', '-filter_complex', '-lavfi', '-filter_complex_script')
+
+# Image sequence inputs keyed by output path, frame range, and recorded frames, so repeated encodes don't check the frames again
+ffmpegInputCache = {}
+FFMPEG_INPUT_CACHE_LIMIT = 16
+
+# Concat lists are released from job watcher threads while the next render may be updating the cache
+ffmpegInputLock = threading.Lock()
+
+# Concat lists are temporary files with this prefix, removed once they're no longer cached or used by a job
+FFMPEG_LIST_PREFIX = 'VF_autosaveRender-'
+
+def ffmpegSequenceInput(scene):
+	key = (scene.render.filepath, scene.render.file_extension, scene.frame_start, scene.frame_end, scene.frame_step, scene.render.use_overwrite, tuple(renderState["written"].items()))
+	with ffmpegInputLock:
+		arguments = ffmpegInputCache.get(key)
+	if arguments is None:
+		# Frames written during this render, plus existing frames that were skipped when overwriting is disabled (resumed renders never write them)
+		# •With overwriting enabled, files left in the range by earlier renders are stale and never included
+		frames = []
+		resumed = range(scene.frame_start, scene.frame_end + 1, max(scene.frame_step, 1)) if not scene.render.use_overwrite else ()
+		for frame in sorted(set(resumed).union(renderState["written"])):
+			path = renderState["written"].get(frame)
+			if path is None:
+				path = scene.render.frame_path(frame=frame)
+				if not os.path.exists(path):
+					continue
+			frames.append((frame, path))
+		if not frames:
+			return None
+		
+		# Numbered output path as an image2 pattern (replacing the last group of #s, or appending four digits like Blender does)
+		absolute_path = bpy.path.abspath(scene.render.filepath).replace('%', '%%')
+		padding = findall(r'#+', absolute_path)
+		pattern = sub(r'#+(?!.*#)', '%0' + str(len(padding[-1])) + 'd', absolute_path) if padding else absolute_path + '%04d'
+		pattern += scene.render.file_extension
+		
+		# Consecutive frames matching the pattern are read directly, anything else (frame steps, per frame paths, or gaps) uses a concat list
+		# •The frame count stops image2 from reading older files numbered after the last frame
+		first = frames[0][0]
+		if all(frame == first + index and path == pattern % frame for index, (frame, path) in enumerate(frames)):
+			arguments = ['-f', 'image2', '-start_number', str(first), '-i', pattern, '-frames:v', str(len(frames))]
+		else:
+			import tempfile
+			with tempfile.NamedTemporaryFile('w', prefix=FFMPEG_LIST_PREFIX, suffix='.txt', delete=False) as fileout:
+				fileout.write('ffconcat version 1.0\n')
+				fileout.writelines("file '" + path.replace("'", "'\\''") + "'\n" for frame, path in frames)
+			arguments = ['-f', 'concat', '-safe', '0', '-i', fileout.name]
+		
+		# Remove the oldest input when the cache is full
+		evicted = None
+		with ffmpegInputLock:
+			if len(ffmpegInputCache) >= FFMPEG_INPUT_CACHE_LIMIT:
+				evicted = ffmpegInputCache.pop(next(iter(ffmpegInputCache)))
+			ffmpegInputCache[key] = arguments
+		if evicted is not None:
+			releaseFFmpegInput(evicted)
+	return arguments
+
+def ffmpegListFile(arguments):
+	# Concat list created by ffmpegSequenceInput, if the arguments use one
+	for index in range(len(arguments) - 5):
+		if arguments[index:index + 5] == ['-f', 'concat', '-safe', '0', '-i'] and os.path.basename(arguments[index + 5]).startswith(FFMPEG_LIST_PREFIX):
+			return arguments[index + 5]
+	return None
+
+def releaseFFmpegInput(arguments):
+	# Delete a concat list once it's neither cached nor used by a queued or running job
+	path = ffmpegListFile(arguments)
+	if path is None:
+		return
+	with ffmpegInputLock:
+		cached = any(ffmpegListFile(inputs) == path for inputs in ffmpegInputCache.values())
+	if cached or ffmpegRunner.uses(path):
+		return
+	try:
+		os.remove(path)
+	except OSError:
+		pass
+
+def clearFFmpegInputCache():
+	with ffmpegInputLock:
+		inputs = list(ffmpegInputCache.values())
+		ffmpegInputCache.clear()
+	for arguments in inputs:
+		releaseFFmpegInput(arguments)
+
+def ffmpegCommandString(command):
+	# Readable command for the terminal
+	import shlex
+	return ' '.join(shlex.quote(argument) for argument in command)
+
+def splitFFmpegCustomCommand(tokens):
+	# Only commands using the documented "{fps} {input} ... {output}" order with a single output can be combined
+	if tokens[:2] != ['{fps}', '{input}'] or sum('{output}' in token for token in tokens) != 1 or '{output}' not in tokens[-1]:
+		return None, None
+	options = tokens[2:]
+	if '{fps}' in options or '{input}' in options or any(option in FFMPEG_UNCOMBINABLE for option in options):
+		return None, None
+	# Video filters are moved into the combined filter graph
+	video_filter = ''
+	for flag in ('-vf', '-filter:v'):
+		if flag in options[:-1]:
+			index = options.index(flag)
+			video_filter = options[index + 1]
+			options = options[:index] + options[index + 2:]
+	# Filters with their own graph syntax can't be inserted into the combined graph
+	if ';' in video_filter or '[' in video_filter:
+		return None, None
+	return video_filter, options
+
+def expandFFmpegCustomCommand(tokens, fps_args, input_args, thread_args, output_path):
+	arguments = []
+	for token in tokens:
+		if token == '{fps}':
+			arguments += fps_args
+		elif token == '{input}':
+			arguments += input_args
+		elif '{output}' in token:
+			arguments += thread_args + ['-y', token.replace('{output}', output_path)]
+		else:
+			arguments.append(token)
+	return arguments
+
+def ffmpegOutputs(settings, ffmpeg_location, fps_args, input_args, thread_args, outputPath):
+	# Returns (name, command, video filter, output options, output file) for each enabled video format
+	# •Video filter and output options are None for custom commands that can't be combined, output file is None if it can't be determined
+	# •outputPath(name, location) returns the output path without file extension
+	outputs = []
+	
+	# ProRes output
+	if settings.autosave_video_prores:
+		output_path = outputPath('ProRes', settings.autosave_video_prores_location)
+		# ProRes format
+		output_options = ['-c:v', 'prores', '-pix_fmt', 'yuv422p10le']
+		# ProRes profile (Proxy, LT, 422 HQ)
+		output_options += ['-profile:v', str(settings.autosave_video_prores_quality)]
+		# Final output settings
+		output_options += ['-vendor', 'apl0', '-an', '-sn'] + thread_args
+		# Output file path
+		output_options += ['-y', output_path + '.mov']
+		
+		# FFmpeg location, frame rate, image sequence input, and output
+		outputs.append(('ProRes', [ffmpeg_location] + fps_args + input_args + output_options, '', output_options, output_path + '.mov'))
+	
+	# MP4 output
+	if settings.autosave_video_mp4:
+		output_path = outputPath('MP4', settings.autosave_video_mp4_location)
+		# MP4 format
+		output_options = ['-c:v', 'libx264', '-preset', 'slow']
+		# MP4 quality (0-51 from highest to lowest quality)
+		output_options += ['-crf', str(settings.autosave_video_mp4_quality)]
+		# Final output settings
+		output_options += ['-pix_fmt', 'yuv420p', '-movflags', 'rtphint'] + thread_args
+		# Output file path
+		output_options += ['-y', output_path + '.mp4']
+		
+		# FFmpeg location, frame rate, image sequence input, and output
+		outputs.append(('MP4', [ffmpeg_location] + fps_args + input_args + output_options, '', output_options, output_path + '.mp4'))
+	
+	# Custom output
+	if settings.autosave_video_custom:
+		output_path = outputPath('custom', settings.autosave_video_custom_location)
+		import shlex
+		try:
+			tokens = shlex.split(settings.autosave_video_custom_command)
+		except ValueError as exc:
+			print(str(exc) + " | Error in VF Autosave Render: failed to read FFmpeg custom command")
+			return outputs
+		# FFmpeg location and command with variables replaced
+		ffmpeg_command = [ffmpeg_location] + expandFFmpegCustomCommand(tokens, fps_args, input_args, thread_args, output_path)
+		
+		# Split the custom command into a video filter and output options so it can be combined with other outputs
+		video_filter, output_options = splitFFmpegCustomCommand(tokens)
+		if output_options is not None:
+			output_options = expandFFmpegCustomCommand(output_options, fps_args, input_args, thread_args, output_path)
+		# Output file is only known when the command has a single output
+		output_files = [token.replace('{output}', output_path) for token in tokens if '{output}' in token]
+		outputs.append(('custom', ffmpeg_command, video_filter, output_options, output_files[0] if len(output_files) == 1 else None))
+	
+	return outputs
+
+def ffmpegCommand(input_command, outputs):
+	if len(outputs) > 1:
+		return combineFFmpegOutputs(input_command, outputs)
+	name, ffmpeg_command, video_filter, output_options, output_file = outputs[0]
+	return input_command + (['-vf', video_filter] if video_filter else []) + output_options
+
+def ffmpegJobs(input_command, outputs, combine=False):
+	# Returns (name, command) for each FFmpeg process needed to encode the outputs, encoding all combinable outputs from a single process if enabled
+	combined = [output for output in outputs if output[3] is not None] if combine else []
+	if len(combined) > 1:
+		return [(' + '.join(output[0] for output in combined), combineFFmpegOutputs(input_command, combined))] + [(output[0], output[1]) for output in outputs if output[3] is None]
+	return [(output[0], output[1]) for output in outputs]
+
+def combineFFmpegOutputs(input_command, outputs):
+	# Frame counts are output options that only apply to the next output, so they're repeated for every output
+	frame_limit = []
+	if '-frames:v' in input_command:
+		index = input_command.index('-frames:v')
+		frame_limit = input_command[index:index + 2]
+		input_command = input_command[:index] + input_command[index + 2:]
+	# Split decoded frames into one stream per output, applying each output's video filter to its own stream
+	graph = '[0:v]split=' + str(len(outputs)) + ''.join('[v' + str(index) + ']' for index in range(len(outputs)))
+	arguments = []
+	for index, (name, ffmpeg_command, video_filter, output_options, output_file) in enumerate(outputs):
+		stream = '[v' + str(index) + ']'
+		if video_filter:
+			graph += ';' + stream + video_filter + '[f' + str(index) + ']'
+			stream = '[f' + str(index) + ']'
+		arguments += ['-map', stream] + frame_limit + output_options
+	return input_command + ['-filter_complex', graph] + arguments
+
+
+
+###########################################################################
+# FFmpeg job runner
+# •Video encodes are started as background processes so Blender stays responsive after a sequence render
+# •Each running job is watched by a thread that starts the next queued job when it finishes, so encodes keep moving while a batch render blocks the interface
+# •The number of concurrent jobs is set in the add-on preferences (one at a time by default)
+# •Output of each job is collected and reported together once every job from the same render has finished
+# •A timer refreshes the status display, and background mode renders wait for running encodes before Blender exits
+
+# Seconds between status display refreshes while FFmpeg jobs are active
+FFMPEG_POLL_INTERVAL = 0.5
+
+# Lines of output reported for successful jobs (failed jobs report everything)
+FFMPEG_REPORT_LINES = 2
+
+class FFmpegJob:
+	__slots__ = ("name", "command", "group", "log", "process", "thread", "started", "elapsed", "returncode", "frames", "outputs", "renames", "fallback")
+	
+	def __init__(self, name, command, group):
+		self.name = name
+		self.command = command
+		self.group = group
+		self.log = None
+		self.process = None
+		self.thread = None
+		self.started = None
+		self.elapsed = None
+		self.returncode = None
+		# Streaming jobs only: queue of frame paths, temporary output files by output name, (temporary, final) file moves, and (name, command) jobs encoding the saved frames instead if streaming fails
+		self.frames = None
+		self.outputs = None
+		self.renames = []
+		self.fallback = []
+
+class FFmpegRunner:
+	def __init__(self):
+		self.lock = threading.Lock()
+		self.queued = deque()
+		self.running = []
+		self.finished = []
+		self.limit = 1
+		self.exit_registered = False
+	
+	def submit(self, name, command, group=None, limit=1):
+		with self.lock:
+			self.limit = max(limit, 1)
+			self.queued.append(FFmpegJob(name, command, group))
+			self.startQueued()
+		self.watch()
+	
+	def stream(self, name, command, outputs, group=None):
+		import queue
+		job = FFmpegJob(name, command, group)
+		job.frames = queue.Queue()
+		job.outputs = outputs
+		with self.lock:
+			# Streams start immediately, regardless of the concurrency limit, so frames are encoded as they're rendered
+			started = self.launch(job)
+		self.watch()
+		return job if started else None
+	
+	def finishStream(self, job, renames, fallback=[], limit=1):
+		job.renames = renames
+		job.fallback = fallback
+		self.limit = max(limit, 1)
+		job.frames.put(None)
+	
+	def watch(self):
+		if bpy.app.background:
+			# Timers don't run in background mode, so remaining jobs are finished when Blender exits
+			if not self.exit_registered:
+				import atexit
+				atexit.register(self.drain)
+				self.exit_registered = True
+		elif not bpy.app.timers.is_registered(autosave_render_ffmpeg_poll):
+			bpy.app.timers.register(autosave_render_ffmpeg_poll, first_interval=FFMPEG_POLL_INTERVAL)
+	
+	# Called with the lock held
+	def startQueued(self):
+		while self.queued and len(self.running) < self.limit:
+			self.launch(self.queued.popleft())
+	
+	# Called with the lock held
+	def launch(self, job):
+		import subprocess
+		import tempfile
+		job.started = time.perf_counter()
+		try:
+			job.log = tempfile.TemporaryFile(mode='w+', errors='replace')
+			job.process = subprocess.Popen(job.command, stdin=subprocess.PIPE if job.frames else subprocess.DEVNULL, stdout=job.log, stderr=subprocess.STDOUT)
+		except Exception as exc:
+			print(str(exc) + " | Error in VF Autosave Render: failed to process FFmpeg " + job.name + " command")
+			job.elapsed = 0.0
+			self.finished.append(job)
+			self.report(job.group)
+			return False
+		self.running.append(job)
+		job.thread = threading.Thread(target=self.wait, args=(job,), daemon=True)
+		job.thread.start()
+		return True
+	
+	def feed(self, job):
+		# Write each frame to FFmpeg as it arrives, closing the pipe when the render finishes or is canceled so FFmpeg completes the video
+		# Returns False if any frame couldn't be sent
+		failed = False
+		while True:
+			path = job.frames.get()
+			if path is None:
+				break
+			if failed:
+				continue
+			try:
+				with open(path, 'rb') as filein:
+					job.process.stdin.write(filein.read())
+			except Exception as exc:
+				print(str(exc) + " | Error in VF Autosave Render: failed to stream frame to FFmpeg " + job.name)
+				failed = True
+		try:
+			job.process.stdin.close()
+		except Exception:
+			pass
+		return not failed
+	
+	def wait(self, job):
+		streamed = self.feed(job) if job.frames is not None else True
+		job.process.wait()
+		failed = not streamed or job.process.returncode != 0
+		fallback = []
+		if job.frames is not None:
+			# Move streamed videos to their final locations, counting any failed move as a failed stream
+			moved = set()
+			if not failed:
+				for source, target in job.renames:
+					try:
+						os.replace(source, target)
+						moved.add(source)
+					except Exception as exc:
+						print(str(exc) + " | Error in VF Autosave Render: failed to move streamed video to " + target)
+						failed = True
+			# Remove temporary videos that weren't moved (incomplete, failed to move, or without a final location)
+			for source in job.outputs.values():
+				if source not in moved:
+					try:
+						os.remove(source)
+					except OSError:
+						pass
+			# Encode the saved frames instead
+			if failed:
+				fallback = job.fallback
+				for name, command in fallback:
+					print('FFmpeg streaming failed, encoding ' + name + ' from the saved frames:')
+					print(ffmpegCommandString(command))
+					print('')
+		with self.lock:
+			job.elapsed = time.perf_counter() - job.started
+			if profileState["enabled"]:
+				profileRecord('FFmpeg ' + job.name, job.elapsed, job.group)
+			job.returncode = job.process.returncode or (-1 if failed else 0)
+			self.running.remove(job)
+			self.finished.append(job)
+			# Fallback jobs share the stream's group so all results are reported together
+			for name, command in fallback:
+				self.queued.append(FFmpegJob(name, command, job.group))
+			self.startQueued()
+			self.report(job.group)
+		# Remove the job's concat list if it's no longer needed
+		releaseFFmpegInput(job.command)
+	
+	# Called with the lock held
+	def report(self, group):
+		if any(job.group == group for job in self.running) or any(job.group == group for job in self.queued):
+			return
+		jobs = [job for job in self.finished if job.group == group]
+		self.finished = [job for job in self.finished if job.group != group]
+		lines = ['VF Autosave Render FFmpeg results:']
+		for job in jobs:
+			output = []
+			if job.log:
+				job.log.seek(0)
+				output = job.log.read().splitlines()
+				job.log.close()
+			if job.returncode == 0:
+				lines.append('  ' + job.name + ' finished in ' + secondsToReadable(job.elapsed))
+				output = output[-FFMPEG_REPORT_LINES:]
+			elif job.returncode is None:
+				lines.append('  ' + job.name + ' could not be started')
+			else:
+				lines.append('  ' + job.name + ' failed with exit code ' + str(job.returncode) + ' after ' + secondsToReadable(job.elapsed))
+			lines.extend('    ' + line for line in output if line.strip())
+		# Encode timings are reported with the render that started them, even if another render has started since
+		profile = profileGroupResults(group)
+		if profile:
+			lines.append('VF Autosave Render FFmpeg profile:')
+			lines.extend(profileLine(name, count, total) for name, count, total in profile)
+		print('\n'.join(lines) + '\n')
+	
+	def active(self):
+		with self.lock:
+			return bool(self.queued or self.running)
+	
+	def uses(self, path):
+		with self.lock:
+			return any(path in job.command for job in self.running) or any(path in job.command for job in self.queued)
+	
+	def drain(self):
+		while True:
+			with self.lock:
+				threads = [job.thread for job in self.running]
+			if not threads:
+				return
+			for thread in threads:
+				thread.join()
+	
+	def status(self):
+		with self.lock:
+			if not self.running and not self.queued:
+				return None
+			return "FFmpeg " + ", ".join(job.name for job in self.running) + (" (" + str(len(self.queued)) + " queued)" if self.queued else "")
+
+ffmpegRunner = FFmpegRunner()
+
+def autosave_render_ffmpeg_poll():
+	active = ffmpegRunner.active()
+	# Refresh the Image Editor status display
+	try:
+		for window in bpy.context.window_manager.windows:
+			for area in window.screen.areas:
+				if area.type == 'IMAGE_EDITOR':
+					area.tag_redraw()
+	except Exception:
+		pass
+	return FFMPEG_POLL_INTERVAL if active else None
+
+
+
+###########################################################################
+# Streaming video encode
+# •Record the path of every frame written during a sequence render
+# •Optionally start FFmpeg when the second frame is written (confirming it's a sequence) and pipe each frame to it as soon as it's saved
+# •Videos are encoded to temporary files alongside the first frame, then moved to their final locations when rendering finishes (or is canceled)
+
+# Decoders for piped images, by Blender file format
+FFMPEG_PIPE_CODECS = {
+	'BMP': 'bmp',
+	'PNG': 'png',
+	'JPEG': 'mjpeg',
+	'DPX': 'dpx',
+	'OPEN_EXR': 'exr',
+	'TIFF': 'tiff'}
+
+def startFFmpegStream(scene, prefs):
+	if scene.render.image_settings.file_format not in FFMPEG_PIPE_CODECS:
+		return None
+	checkExternalTools(ffmpeg=True, say=False)
+	addon = bpy.context.preferences.addons['VF_autosaveRender'].preferences
+	if not addon.ffmpeg_exists:
+		return None
+	
+	# Limit decoding and encoding threads per job if set (0 leaves the choice to FFmpeg)
+	thread_args = ['-threads', str(prefs.ffmpeg_threads)] if prefs.ffmpeg_threads else []
+	# Read frames from standard input in the order they're rendered
+	input_args = thread_args + ['-f', 'image2pipe', '-c:v', FFMPEG_PIPE_CODECS[scene.render.image_settings.file_format], '-i', '-']
+	# Create floating point FPS value
+	fps_args = ['-r', str(scene.render.fps / scene.render.fps_base)]
+	# Temporary outputs named after the first frame, since final paths may use variables that are only available after rendering
+	temporary_path = os.path.splitext(next(iter(renderState["written"].values())))[0] + '-streaming-'
+	
+	# Only outputs that can share a single input are streamed, others are encoded after rendering
+	outputs = ffmpegOutputs(settingsSnapshot(scene.autosave_render_settings), addon.ffmpeg_location, fps_args, input_args, thread_args, lambda name, location: temporary_path + name)
+	outputs = [output for output in outputs if output[3] is not None and output[4] is not None]
+	if not outputs:
+		return None
+	ffmpeg_command = ffmpegCommand([addon.ffmpeg_location] + fps_args + input_args, outputs)
+	
+	# Print command to the terminal
+	print('FFmpeg streaming command:')
+	print(ffmpegCommandString(ffmpeg_command))
+	print('')
+	
+	stream = ffmpegRunner.stream(' + '.join(output[0] for output in outputs) + ' stream', ffmpeg_command, {output[0]: output[4] for output in outputs}, group=renderState["start"])
+	if stream:
+		for path in renderState["written"].values():
+			stream.frames.put(path)
+	return stream
+
+@persistent
+@profiled
+def autosave_render_write(scene):
+	prefs = renderState["preferences"]
+	if prefs is None or not prefs.ffmpeg_processing:
+		return
+	
+	path = renderState["written"][scene.frame_current] = scene.render.frame_path(frame=scene.frame_current)
+	
+	if renderState["stream"]:
+		renderState["stream"].frames.put(path)
+	elif prefs.ffmpeg_streaming and scene.render.use_overwrite and len(renderState["written"]) == 2:
+		# Resumed renders with overwriting disabled skip existing frames, so streaming is limited to renders that write every frame
+		try:
+			renderState["stream"] = startFFmpegStream(scene, prefs)
+		except Exception as exc:
+			print(str(exc) + " | Error in VF Autosave Render: failed to start FFmpeg streaming")
+
 
 
 ###########################################################################
@@ -828,8 +2348,11 @@ class AutosaveRenderCopyToClipboard(bpy.types.Operator):
 # •Send email notification
 # •Send Pushover notification
 
+@profiled
 def send_email(subject, message):
 	try:
+		import smtplib
+		from email.mime.text import MIMEText
 		msg = MIMEText(message)
 		msg['Subject'] = subject
 		msg['From'] = bpy.context.preferences.addons['VF_autosaveRender'].preferences.email_from
@@ -840,8 +2363,10 @@ def send_email(subject, message):
 	except Exception as exc:
 		print(str(exc) + " | Error in VF Autosave Render: failed to send email notification")
 		
+@profiled
 def send_pushover(subject, message):
 	try:
+		import requests
 		r = requests.post('https://api.pushover.net/1/messages.json', data = {
 			"token": bpy.context.preferences.addons['VF_autosaveRender'].preferences.pushover_app,
 			"user": bpy.context.preferences.addons['VF_autosaveRender'].preferences.pushover_key,
@@ -872,6 +2397,14 @@ class AutosaveRenderPreferences(bpy.types.AddonPreferences):
 		name='Render Variables',
 		description='Implements dynamic keywords in the Output directory and Compositing tab "File Output" nodes',
 		default=True)
+	render_output_variables_frame: bpy.props.BoolProperty(
+		name='Update Every Frame',
+		description='Updates Output directory and "File Output" node paths that use frame, date, or time variables before each frame of an animation is rendered',
+		default=False)
+	output_path_journal: bpy.props.BoolProperty(
+		name='Path Recovery File',
+		description='Saves original output paths alongside the project file while rendering, restoring them when the project is next opened if Blender crashes before rendering completes',
+		default=False)
 	
 	# Autosave Images
 	enable_autosave_render: bpy.props.BoolProperty(
@@ -893,7 +2426,8 @@ class AutosaveRenderPreferences(bpy.types.AddonPreferences):
 		description="Leave a single forward slash to auto generate folders alongside project files",
 		default="/",
 		maxlen=4096,
-		subtype="DIR_PATH")
+		subtype="DIR_PATH",
+		update=lambda self, context: compileTemplate(self.file_location_global))
 	
 	file_name_override: bpy.props.BoolProperty(
 		name="Override File Name",
@@ -913,7 +2447,8 @@ class AutosaveRenderPreferences(bpy.types.AddonPreferences):
 		name="Global Custom String",
 		description="Format a custom string using the variables listed below",
 		default="{project}-{serial}",
-		maxlen=4096)
+		maxlen=4096,
+		update=lambda self, context: compileTemplate(self.file_name_custom_global))
 	file_serial_global: bpy.props.IntProperty(
 		name="Global Serial Number",
 		description="Current serial number, automatically increments with every render (must be manually updated when installing a plugin update)")
@@ -937,7 +2472,8 @@ class AutosaveRenderPreferences(bpy.types.AddonPreferences):
 	ffmpeg_processing: bpy.props.BoolProperty(
 		name='Autosave Videos',
 		description='Enables FFmpeg image sequence compilation options in the Output panel',
-		default=True)
+		default=True,
+		update=lambda self, context: self.check_ffmpeg_location() if self.ffmpeg_processing else None)
 	ffmpeg_location: bpy.props.StringProperty(
 		name="FFmpeg location",
 		description="System location where the the FFmpeg command line interface is installed",
@@ -949,23 +2485,40 @@ class AutosaveRenderPreferences(bpy.types.AddonPreferences):
 		name="FFmpeg exists",
 		description='Stores the existence of FFmpeg at the defined system location',
 		default=False)
+	ffmpeg_jobs: bpy.props.IntProperty(
+		name="Concurrent Videos",
+		description="Number of FFmpeg encodes that can run at the same time; 1 encodes each enabled video format one after another",
+		default=1,
+		soft_max=4,
+		min=1,
+		max=16)
+	ffmpeg_threads: bpy.props.IntProperty(
+		name="Threads Per Video",
+		description="Maximum number of threads used by each FFmpeg encode, preventing concurrent encodes from oversubscribing the processor; 0 lets FFmpeg decide",
+		default=0,
+		soft_max=32,
+		min=0,
+		max=256)
+	ffmpeg_streaming: bpy.props.BoolProperty(
+		name="Encode While Rendering",
+		description="Starts FFmpeg when the second frame of a sequence is saved and sends it each frame as soon as it's written, so videos are ready moments after rendering finishes; canceled renders keep a partial video",
+		default=False)
+	ffmpeg_combined: bpy.props.BoolProperty(
+		name="Single Decode",
+		description="Encodes all enabled video formats from a single FFmpeg process that reads the image sequence once; custom commands are only combined when they use the default \"{fps} {input} ... {output}\" layout without additional inputs or filter graphs",
+		default=False)
 	
-	# Validate the ffmpeg location string on value change and plugin registration
+	# Validate the ffmpeg location string on value change and before use
 	def check_ffmpeg_location(self):
 		# Ensure it points at ffmpeg
 		if not self.ffmpeg_location.endswith('ffmpeg'):
 			self.ffmpeg_location = self.ffmpeg_location + 'ffmpeg'
 		# Test if it's a valid path and replace with valid path if such exists
-		if self.ffmpeg_location != self.ffmpeg_location_previous:
-			if which(self.ffmpeg_location) is None:
-				if which("ffmpeg") is None:
-					self.ffmpeg_exists = False
-				else:
-					self.ffmpeg_location = which("ffmpeg")
-					self.ffmpeg_exists = True
-			else:
-				self.ffmpeg_exists = True
-			self.ffmpeg_location_previous = self.ffmpeg_location
+		tool = findTool('ffmpeg', self.ffmpeg_location, version=True)
+		if tool and not tool.configured:
+			self.ffmpeg_location = tool.path
+		updateSetting(self, "ffmpeg_exists", tool is not None)
+		updateSetting(self, "ffmpeg_location_previous", self.ffmpeg_location)
 	
 	# Render Time Tracking
 	show_estimated_render_time: bpy.props.BoolProperty(
@@ -985,6 +2538,55 @@ class AutosaveRenderPreferences(bpy.types.AddonPreferences):
 		description="Log file name; use {project} for per-project tracking, remove it for per-directory tracking",
 		default="{project}-TotalRenderTime.txt",
 		maxlen=4096)
+	frame_journal: bpy.props.BoolProperty(
+		name="Save Frame Time Journal",
+		description='Appends the time spent on each rendered frame to an external journal file',
+		default=False)
+	frame_journal_name: bpy.props.StringProperty(
+		name="File Name",
+		description="Journal file name without extension; use {project} for per-project tracking, remove it for per-directory tracking",
+		default="{project}-FrameTimes",
+		maxlen=4096)
+	frame_journal_format: bpy.props.EnumProperty(
+		name='Journal Format',
+		description='File format of the frame time journal',
+		items=[
+			('JSONL', 'JSON Lines', 'One JSON object per frame (.jsonl)'),
+			('CSV', 'CSV', 'Comma separated values with a header row (.csv)'),
+			],
+		default='JSONL')
+	
+	# Render history
+	render_history: bpy.props.BoolProperty(
+		name="Save Render History",
+		description='Records the settings and render time of each completed render, and displays predicted render times based on previous renders',
+		default=False)
+	render_history_file: bpy.props.StringProperty(
+		name="History File",
+		description="Render history file; leave empty to use the Blender user configuration folder, shared by all projects on this computer",
+		default="",
+		maxlen=4096,
+		subtype="FILE_PATH")
+	
+	# Profiling
+	profiling: bpy.props.BoolProperty(
+		name="Profile Add-on Stages",
+		description='Times the add-on handlers and post-processing stages during each render',
+		default=False,
+		update=lambda self, context: profileState.update(enabled=self.profiling))
+	profile_output: bpy.props.EnumProperty(
+		name='Profile Output',
+		description='Where to report profiling results after each render',
+		items=[
+			('PANEL', 'Panel Only', 'Display results in the Output panel'),
+			('CONSOLE', 'Console', 'Also print results to the system console'),
+			('FILE', 'File', 'Also append results to {project}-Profile.txt alongside the project'),
+			],
+		default='PANEL')
+	show_profile: bpy.props.BoolProperty(
+		name="Add-on Profile",
+		description="Show profiling results from the last render",
+		default=False)
 	
 	# Render Complete Notifications
 	minimum_time: bpy.props.IntProperty(
@@ -1025,12 +2627,14 @@ class AutosaveRenderPreferences(bpy.types.AddonPreferences):
 		name="Email Subject",
 		description="Text string sent as the email subject line",
 		default="{project} rendering completed",
-		maxlen=1024)
+		maxlen=1024,
+		update=lambda self, context: compileTemplate(self.email_subject))
 	email_message: bpy.props.StringProperty(
 		name="Email Body",
 		description="Text string sent as the email body copy",
 		default="{project} rendering completed in {rH}:{rM}:{rS} on {host}",
-		maxlen=4096)
+		maxlen=4096,
+		update=lambda self, context: compileTemplate(self.email_message))
 	
 	# Pushover app notifications
 	pushover_enable: bpy.props.BoolProperty(
@@ -1051,18 +2655,21 @@ class AutosaveRenderPreferences(bpy.types.AddonPreferences):
 		name="Pushover Title",
 		description="Notification title that will be sent to Pushover devices",
 		default="{project} rendering completed",
-		maxlen=1024)
+		maxlen=1024,
+		update=lambda self, context: compileTemplate(self.pushover_subject))
 	pushover_message: bpy.props.StringProperty(
 		name="Pushover Message",
 		description="Notification message that will be sent to Pushover devices",
 		default="{project} rendering completed in {rH}:{rM}:{rS} on {host}",
-		maxlen=4096)
+		maxlen=4096,
+		update=lambda self, context: compileTemplate(self.pushover_message))
 	
 	# MacOS Siri text-to-speech announcement
 	macos_say_enable: bpy.props.BoolProperty(
 		name='Siri Announcement',
 		description='Enable MacOS Siri text-to-speech announcements',
-		default=False)
+		default=False,
+		update=lambda self, context: self.check_macos_say_location() if self.macos_say_enable else None)
 	macos_say_exists: bpy.props.BoolProperty(
 		name="MacOS Say exists",
 		description='Stores the existence of MacOS Say',
@@ -1071,12 +2678,13 @@ class AutosaveRenderPreferences(bpy.types.AddonPreferences):
 		name="Siri Message",
 		description="Message that Siri will read out loud",
 		default="{project} rendering completed in {rH} hours, {rM} minutes, and {rS} seconds",
-		maxlen=2048)
+		maxlen=2048,
+		update=lambda self, context: compileTemplate(self.macos_say_message))
 	
 	# Validate the MacOS Say location on plugin registration
 	def check_macos_say_location(self):
 		# Test if it's a valid path
-		self.macos_say_exists = False if which('say') is None else True
+		updateSetting(self, "macos_say_exists", findTool('say') is not None)
 	
 	
 	
@@ -1091,6 +2699,17 @@ class AutosaveRenderPreferences(bpy.types.AddonPreferences):
 		grid1.prop(self, "render_output_variables")
 		ops = grid1.operator(AutosaveRenderVariablePopup.bl_idname, text = "Variable List", icon = "LINENUMBERS_OFF")
 		ops.postrender = True
+		input = grid1.row()
+		input.separator(factor=2.0)
+		input.prop(self, "render_output_variables_frame")
+		if not self.render_output_variables:
+			input.active = False
+			input.enabled = False
+		input = grid1.row()
+		input.prop(self, "output_path_journal")
+		if not self.render_output_variables:
+			input.active = False
+			input.enabled = False
 		
 		# Autosave Videos - FFmpeg Sequencing
 		grid1.prop(self, "ffmpeg_processing")
@@ -1101,9 +2720,35 @@ class AutosaveRenderPreferences(bpy.types.AddonPreferences):
 		input.prop(self, "ffmpeg_location", text="")
 		# Location exists success/fail
 		if self.ffmpeg_exists:
-			input.label(text="✔︎ installed")
+			tool = toolCache.get(('ffmpeg', self.ffmpeg_location))
+			if isinstance(tool, ToolEntry) and tool.version:
+				input.label(text="✔︎ " + sub(r' Copyright.*$', '', tool.version))
+			else:
+				input.label(text="✔︎ installed")
 		else:
 			input.label(text="✘ missing")
+		input = grid1.row()
+		input.separator(factor=2.0)
+		input.prop(self, "ffmpeg_jobs")
+		if not self.ffmpeg_processing:
+			input.active = False
+			input.enabled = False
+		input = grid1.row()
+		input.prop(self, "ffmpeg_threads")
+		if not self.ffmpeg_processing:
+			input.active = False
+			input.enabled = False
+		input = grid1.row()
+		input.separator(factor=2.0)
+		input.prop(self, "ffmpeg_combined")
+		if not self.ffmpeg_processing:
+			input.active = False
+			input.enabled = False
+		input = grid1.row()
+		input.prop(self, "ffmpeg_streaming")
+		if not self.ffmpeg_processing:
+			input.active = False
+			input.enabled = False
 		
 		# Autosave Images
 		grid1.prop(self, "enable_autosave_render")
@@ -1131,6 +2776,7 @@ class AutosaveRenderPreferences(bpy.types.AddonPreferences):
 				input.active = False
 				input.enabled = False
 			input.prop(self, "file_location_global", text='')
+			templateWarning(input, self.file_location_global)
 			# Display global serial number if used
 			if self.file_location_override and '{serial}' in self.file_location_global:
 				input.prop(self, "file_serial_global")
@@ -1145,6 +2791,7 @@ class AutosaveRenderPreferences(bpy.types.AddonPreferences):
 			input.prop(self, "file_name_type_global", text='', icon='FILE_TEXT')
 			if (self.file_name_type_global == 'CUSTOM'):
 				input.prop(self, "file_name_custom_global", text='')
+				templateWarning(input, self.file_name_custom_global)
 				if self.file_name_override and self.file_name_type_global == 'CUSTOM' and '{serial}' in self.file_name_custom_global:
 					input.prop(self, "file_serial_global")
 				input.separator()
@@ -1183,6 +2830,28 @@ class AutosaveRenderPreferences(bpy.types.AddonPreferences):
 			input.enabled = False
 		input.prop(self, "external_log_name", text='')
 		
+		grid2.prop(self, "frame_journal")
+		input = grid2.row()
+		if not self.frame_journal:
+			input.active = False
+			input.enabled = False
+		input.prop(self, "frame_journal_name", text='')
+		input.prop(self, "frame_journal_format", text='')
+		
+		grid2.prop(self, "render_history")
+		input = grid2.column()
+		if not self.render_history:
+			input.active = False
+			input.enabled = False
+		input.prop(self, "render_history_file", text='')
+		
+		grid2.prop(self, "profiling")
+		input = grid2.column()
+		if not self.profiling:
+			input.active = False
+			input.enabled = False
+		input.prop(self, "profile_output", text='')
+		
 	# Render Completed Notifications
 		layout.separator(factor = 2.0)
 		grid3 = layout.grid_flow(row_major=True, columns=1, even_columns=True, even_rows=False, align=False)
@@ -1226,6 +2895,8 @@ class AutosaveRenderPreferences(bpy.types.AddonPreferences):
 			settings2.prop(self, "email_to", text="", icon="USER")
 			settings2.prop(self, "email_subject", text="", icon="FILE_TEXT")
 			settings2.prop(self, "email_message", text="", icon="ALIGN_JUSTIFY")
+			templateWarning(settings2, self.email_subject)
+			templateWarning(settings2, self.email_message)
 			
 			# Spacing
 			subgrid.separator(factor=2.0)
@@ -1263,6 +2934,8 @@ class AutosaveRenderPreferences(bpy.types.AddonPreferences):
 			settings2.label(text="Message")
 			settings2.prop(self, "pushover_subject", text="", icon="FILE_TEXT")
 			settings2.prop(self, "pushover_message", text="", icon="ALIGN_JUSTIFY")
+			templateWarning(settings2, self.pushover_subject)
+			templateWarning(settings2, self.pushover_message)
 			
 			# Spacing
 			subgrid.separator(factor = 2.0)
@@ -1279,6 +2952,13 @@ class AutosaveRenderPreferences(bpy.types.AddonPreferences):
 				
 				# Message
 				subgrid.prop(self, "macos_say_message", text='', icon="PLAY_SOUND")
+				templateWarning(subgrid, self.macos_say_message)
+		
+	# Add-on load times
+		layout.separator(factor = 2.0)
+		info = layout.row()
+		info.active = False
+		info.label(text="Add-on loaded in {:.2f} ms, registered in {:.2f} ms".format(loadTiming["import"], loadTiming["register"]))
 
 
 
@@ -1291,7 +2971,8 @@ class AutosaveRenderSettings(bpy.types.PropertyGroup):
 		description="Leave a single forward slash to auto generate folders alongside project files",
 		default="/",
 		maxlen=4096,
-		subtype="DIR_PATH")
+		subtype="DIR_PATH",
+		update=lambda self, context: compileTemplate(self.file_location))
 	file_name_type: bpy.props.EnumProperty(
 		name='File Name',
 		description='Autosaves files with the project name and serial number, project name and date, or custom naming pattern',
@@ -1306,7 +2987,8 @@ class AutosaveRenderSettings(bpy.types.PropertyGroup):
 		name="Custom String",
 		description="Format a custom string using the variables listed below",
 		default="{project}-{serial}-{engine}-{duration}",
-		maxlen=4096)
+		maxlen=4096,
+		update=lambda self, context: compileTemplate(self.file_name_custom))
 	file_serial: bpy.props.IntProperty(
 		name="Serial Number",
 		description="Current serial number, automatically increments with every render")
@@ -1322,10 +3004,6 @@ class AutosaveRenderSettings(bpy.types.PropertyGroup):
 		default='JPEG')
 
 	# Variables for render time calculation
-	start_date: bpy.props.StringProperty(
-		name="Render Start Date",
-		description="Stores the date when rendering started in seconds as a string",
-		default="")
 	total_render_time: bpy.props.FloatProperty(
 		name="Total Render Time",
 		description="Stores the total time spent rendering in seconds",
@@ -1336,42 +3014,17 @@ class AutosaveRenderSettings(bpy.types.PropertyGroup):
 		name="Render Active",
 		description="Indicates if rendering is currently active",
 		default=False)
-	estimated_render_time_frame: bpy.props.IntProperty(
-		name="Starting frame",
-		description="Saves the starting frame when render begins (helps correctly estimate partial renders)",
-		default=0)
 	estimated_render_time_value: bpy.props.StringProperty(
 		name="Estimated Render Time",
 		description="Stores the estimated time remaining to render",
 		default="0:00:00.00")
 
 	# Variables for output file path processing
-	output_file_path: bpy.props.StringProperty(
-		name="Original Render Path",
-		description="Stores the original render path as a string to allow for successful restoration after rendering completes",
-		default="")
-	output_file_nodes: bpy.props.StringProperty(
-		name="Original Node Path",
-		description="Stores the original node path as a string to allow for successful restoration after rendering completes",
-		default="")
 	output_file_serial: bpy.props.IntProperty(
 		name="Serial Number",
 		description="Current serial number, automatically increments with every render")
-	output_file_serial_used: bpy.props.BoolProperty(
-		name="Output Serial Number Used",
-		description="Indicates if any of the output modules use the {serial} variable",
-		default=False)
 	
 	# FFmpeg image sequence compilation
-	autosave_video_sequence: bpy.props.BoolProperty(
-		name="Sequence Active",
-		description="Indicates if a sequence is being rendering to ensure FFmpeg is enabled only when more than one frame has been rendered",
-		default=False)
-	autosave_video_sequence_processing: bpy.props.BoolProperty(
-		name="Sequence Processing",
-		description="Indicates if sequence processing is currently active",
-		default=False)
-	
 	autosave_video_prores: bpy.props.BoolProperty(
 		name="Enable ProRes Output",
 		description="Automatically compiles completed image sequences into a ProRes compressed .mov file",
@@ -1391,7 +3044,8 @@ class AutosaveRenderSettings(bpy.types.PropertyGroup):
 		description="Set ProRes file output location and name, use single forward slash to save alongside image sequence",
 		default="//../Renders/{project}",
 		maxlen=4096,
-		subtype="DIR_PATH")
+		subtype="DIR_PATH",
+		update=lambda self, context: compileTemplate(self.autosave_video_prores_location))
 	
 	autosave_video_mp4: bpy.props.BoolProperty(
 		name="Enable MP4 Output",
@@ -1411,7 +3065,8 @@ class AutosaveRenderSettings(bpy.types.PropertyGroup):
 		description="Set MP4 file output location and name, use single forward slash to save alongside image sequence",
 		default="//../Previews/{project}",
 		maxlen=4096,
-		subtype="DIR_PATH")
+		subtype="DIR_PATH",
+		update=lambda self, context: compileTemplate(self.autosave_video_mp4_location))
 	
 	autosave_video_custom: bpy.props.BoolProperty(
 		name="Enable Custom Output",
@@ -1425,13 +3080,15 @@ class AutosaveRenderSettings(bpy.types.PropertyGroup):
 				#{fps} {input} -c:v hevc_videotoolbox -require_sw 1 -allow_sw 1 -alpha_quality 1.0 -vtag hvc1 {output}_alpha.mov
 				#{fps} {input} -pix_fmt yuva420p {output}_alpha.webm
 				#{fps} {input} -c:v libvpx -pix_fmt yuva420p -crf 16 -b:v 1M -auto-alt-ref 0 {output}_alpha.webm
-		maxlen=4096)
+		maxlen=4096,
+		update=lambda self, context: compileTemplate(self.autosave_video_custom_command))
 	autosave_video_custom_location: bpy.props.StringProperty(
 		name="Custom File Location",
 		description="Set custom command file output location and name, use single forward slash to save alongside image sequence",
 		default="/",
 		maxlen=4096,
-		subtype="DIR_PATH")
+		subtype="DIR_PATH",
+		update=lambda self, context: compileTemplate(self.autosave_video_custom_location))
 	
 	# Batch rendering options
 	batch_active: bpy.props.BoolProperty(
@@ -1575,6 +3232,8 @@ class RENDER_PT_autosave_video(bpy.types.Panel):
 		row1b.prop(context.scene.autosave_render_settings, 'autosave_video_prores_quality', expand=True)
 		row2 = layout.row()
 		row2.prop(context.scene.autosave_render_settings, 'autosave_video_prores_location', text='')
+		if bpy.context.scene.autosave_render_settings.autosave_video_prores:
+			templateWarning(layout, bpy.context.scene.autosave_render_settings.autosave_video_prores_location)
 		if not bpy.context.scene.autosave_render_settings.autosave_video_prores:
 			row1b.active = False
 			row1b.enabled = False
@@ -1591,6 +3250,8 @@ class RENDER_PT_autosave_video(bpy.types.Panel):
 		row1b.prop(context.scene.autosave_render_settings, 'autosave_video_mp4_quality', slider=True)
 		row2 = layout.row()
 		row2.prop(context.scene.autosave_render_settings, 'autosave_video_mp4_location', text='')
+		if bpy.context.scene.autosave_render_settings.autosave_video_mp4:
+			templateWarning(layout, bpy.context.scene.autosave_render_settings.autosave_video_mp4_location)
 		if not bpy.context.scene.autosave_render_settings.autosave_video_mp4:
 			row1b.active = False
 			row1b.enabled = False
@@ -1607,6 +3268,9 @@ class RENDER_PT_autosave_video(bpy.types.Panel):
 		row1b.prop(context.scene.autosave_render_settings, 'autosave_video_custom_command', text='')
 		row2 = layout.row()
 		row2.prop(context.scene.autosave_render_settings, 'autosave_video_custom_location', text='')
+		if bpy.context.scene.autosave_render_settings.autosave_video_custom:
+			templateWarning(layout, bpy.context.scene.autosave_render_settings.autosave_video_custom_command, allowed=FFMPEG_COMMAND_VARIABLES)
+			templateWarning(layout, bpy.context.scene.autosave_render_settings.autosave_video_custom_location)
 		if not bpy.context.scene.autosave_render_settings.autosave_video_custom:
 			row1b.active = False
 			row1b.enabled = False
@@ -1653,9 +3317,11 @@ class RENDER_PT_autosave_render(bpy.types.Panel):
 			override.prop(bpy.context.preferences.addons['VF_autosaveRender'].preferences, 'file_location_global')
 			if '{serial}' in bpy.context.preferences.addons['VF_autosaveRender'].preferences.file_location_global:
 				override.prop(bpy.context.preferences.addons['VF_autosaveRender'].preferences, "file_serial_global", text="")
+			templateWarning(layout, bpy.context.preferences.addons['VF_autosaveRender'].preferences.file_location_global)
 		else:
 			layout.use_property_split = False
 			layout.prop(context.scene.autosave_render_settings, 'file_location', text="")
+			templateWarning(layout, bpy.context.scene.autosave_render_settings.file_location)
 			layout.use_property_split = True
 		
 		# File name with global override
@@ -1667,10 +3333,12 @@ class RENDER_PT_autosave_render(bpy.types.Panel):
 				override.prop(bpy.context.preferences.addons['VF_autosaveRender'].preferences, "file_name_custom_global", text='')
 				if '{serial}' in bpy.context.preferences.addons['VF_autosaveRender'].preferences.file_name_custom_global:
 					override.prop(bpy.context.preferences.addons['VF_autosaveRender'].preferences, "file_serial_global", text="")
+				templateWarning(layout, bpy.context.preferences.addons['VF_autosaveRender'].preferences.file_name_custom_global)
 		else:
 			layout.prop(context.scene.autosave_render_settings, 'file_name_type', icon='FILE_TEXT')
 			if bpy.context.scene.autosave_render_settings.file_name_type == 'CUSTOM':
 				layout.prop(context.scene.autosave_render_settings, 'file_name_custom')
+				templateWarning(layout, bpy.context.scene.autosave_render_settings.file_name_custom)
 		
 		# File format with global override
 		if bpy.context.preferences.addons['VF_autosaveRender'].preferences.file_format_override:
@@ -1690,10 +3358,17 @@ class RENDER_PT_autosave_render(bpy.types.Panel):
 
 ###########################################################################
 # Variable info popup and serial number UI
+# •Unknown variable warning
 # •Variable list popup panel
 # •Add variable list button and serial input at the top of the Render tab > Output panel
 # •Add variable list button and serial input at the top of the Compositing workspace > Node tab > Properties panel
 
+# Display any unrecognised variables in a template string (uses the compiled template cache, so this is cheap to call while drawing)
+def templateWarning(layout, string, allowed=()):
+	unknown = [token for token in compileTemplate(string).unknown if token not in allowed]
+	if unknown:
+		layout.label(text=('Unknown variables: ' if len(unknown) > 1 else 'Unknown variable: ') + ' '.join(unknown), icon='ERROR')
+
 # Popup panel UI
 class AutosaveRenderVariablePopup(bpy.types.Operator):
 	"""List of the available variables"""
@@ -1712,11 +3387,11 @@ class AutosaveRenderVariablePopup(bpy.types.Operator):
 		return {'FINISHED'}
 	
 	def invoke(self, context, event):
-		return context.window_manager.invoke_popup(self, width=520)
+		return context.window_manager.invoke_popup(self, width=620)
 	
 	def draw(self, context):
 		layout = self.layout
-		grid = self.layout.grid_flow(row_major=True, columns = 5, even_columns = True, even_rows = True)
+		grid = self.layout.grid_flow(row_major=True, columns = 6, even_columns = True, even_rows = True)
 		for item in variableArray:
 			# Display headers
 			if item.startswith('title,'):
@@ -1734,6 +3409,7 @@ class AutosaveRenderVariablePopup(bpy.types.Operator):
 					ops = col.operator(AutosaveRenderCopyToClipboard.bl_idname, text = item, emboss = False)
 					ops.string = item
 		layout.label(text = 'Click a variable to copy it to the clipboard', icon = "COPYDOWN")
+		layout.operator(AutosaveRenderRefreshSystemVariables.bl_idname, icon = "FILE_REFRESH", emboss = False)
 
 # Render output UI
 def RENDER_PT_output_path_variable_list(self, context):
@@ -1749,6 +3425,7 @@ def RENDER_PT_output_path_variable_list(self, context):
 			input.active = False
 			input.enabled = False
 		input.prop(context.scene.autosave_render_settings, 'output_file_serial')
+		templateWarning(layout, bpy.context.scene.render.filepath)
 
 # Node output UI
 def NODE_PT_output_path_variable_list(self, context):
@@ -1772,6 +3449,9 @@ def NODE_PT_output_path_variable_list(self, context):
 				input.active = False
 				input.enabled = False
 			input.prop(context.scene.autosave_render_settings, 'output_file_serial')
+			# Check each path separately so variables can't be formed across path boundaries
+			for path in [active_node.base_path] + [slot.path for slot in active_node.file_slots]:
+				templateWarning(layout, path)
 			layout.use_property_split = False # Base path interface doesn't specify false, it assumes it, so the UI gets screwed up if we don't reset here
 
 
@@ -1787,6 +3467,45 @@ def RENDER_PT_total_render_time_display(self, context):
 
 
 
+###########################################################################
+# Display predicted render time at the bottom of the Render tab > Output panel
+
+def RENDER_PT_predicted_render_time_display(self, context):
+	if bpy.context.preferences.addons['VF_autosaveRender'].preferences.render_history:
+		prediction = predictRenderTime(context.scene, 1)
+		if prediction:
+			frames = sequenceFrameCount(context.scene)
+			box = self.layout.box()
+			box.label(text="Predicted render time: " + secondsToReadable(prediction[0]) + " per frame, " + secondsToReadable(prediction[0] * frames) + " for " + str(frames) + " frames")
+			box.label(text="Based on " + str(prediction[1]) + " previous render" + ("s" if prediction[1] > 1 else ""))
+
+
+
+###########################################################################
+# Display add-on profiling results at the bottom of the Render tab > Output panel
+
+def RENDER_PT_profile_display(self, context):
+	prefs = bpy.context.preferences.addons['VF_autosaveRender'].preferences
+	if prefs.profiling:
+		layout = self.layout
+		box = layout.box()
+		box.prop(prefs, "show_profile", icon = "DISCLOSURE_TRI_DOWN" if prefs.show_profile else "DISCLOSURE_TRI_RIGHT", emboss = False)
+		if prefs.show_profile:
+			results = profileResults()
+			if not results:
+				box.label(text="Render to collect stage timings")
+			else:
+				grid = box.grid_flow(row_major=True, columns=4, even_columns=False, even_rows=False, align=True)
+				for label in ("Stage", "Calls", "Total", "Average"):
+					grid.label(text=label)
+				for name, count, total in results:
+					grid.label(text=name)
+					grid.label(text=str(count))
+					grid.label(text="%.2f ms" % (total * 1000.0))
+					grid.label(text="%.2f ms" % (total * 1000.0 / count))
+
+
+
 ###########################################################################
 # Display estimated time remaining in the Image viewer during rendering
 
@@ -1795,10 +3514,19 @@ def image_viewer_feedback_display(self, context):
 		self.layout.separator()
 		box = self.layout.box()
 		box.label(text="  Estimated Time Remaining: " + bpy.context.scene.autosave_render_settings.estimated_render_time_value + " ")
-	if bpy.context.scene.autosave_render_settings.autosave_video_sequence_processing:
+		# Frame time statistics from the estimator
+		if renderEstimator.last is not None:
+			box = self.layout.box()
+			box.label(text="  Last Frame: " + secondsToReadable(renderEstimator.last) + "  Average: " + secondsToReadable(renderEstimator.mean) + " ± " + secondsToReadable(renderEstimator.variance ** 0.5) + " ")
+	if batchTimer.started is not None and batchTimer.items:
+		self.layout.separator()
+		box = self.layout.box()
+		box.label(text="  Batch " + str(len(batchTimer.items) + 1) + " of " + str(batchTimer.total) + ", " + secondsToReadable(batchTimer.eta()) + " remaining ")
+	status = ffmpegRunner.status()
+	if status:
 		self.layout.separator()
 		box = self.layout.box()
-		box.label(text="  FFmpeg Image Sequence Processing... ")
+		box.label(text="  " + status + "... ")
 
 
 
@@ -1811,6 +3539,82 @@ def image_viewer_feedback_display(self, context):
 #	•Images (requires specific folder input and target material node)
 # •Set target material > node for Batch Render Images
 
+# Batch timing
+# •Time each item in three phases: setup (camera, visibility, or image changes), render, and post-processing (render complete handlers and restoring item settings)
+# •Estimate time remaining for the whole batch from completed items
+# •Print progress to the console and save a summary file alongside the project when the batch finishes
+
+BATCH_SUMMARY_FIELDS = ("index", "name", "setup", "render", "post", "total")
+
+class BatchTimer:
+	def __init__(self):
+		self.items = []
+		self.total = 0
+		self.type = ''
+		self.started = None
+		self.current = None
+		self.phase = 0.0
+	
+	def start(self, total, type):
+		self.items = []
+		self.total = total
+		self.type = type
+		self.started = time.perf_counter()
+		self.current = None
+	
+	def itemStart(self, name):
+		self.current = {"index": len(self.items), "name": name, "setup": 0.0, "render": 0.0, "post": 0.0, "total": 0.0}
+		self.phase = time.perf_counter()
+	
+	def renderStart(self):
+		now = time.perf_counter()
+		self.current["setup"] = now - self.phase
+		self.phase = now
+		renderState["finished"] = None
+	
+	def renderEnd(self):
+		# Post-processing starts when the render complete or cancel handlers run
+		now = time.perf_counter()
+		finished = renderState["finished"] if renderState["finished"] is not None and renderState["finished"] >= self.phase else now
+		self.current["render"] = finished - self.phase
+		self.phase = finished
+	
+	def itemEnd(self):
+		item = self.current
+		item["post"] = time.perf_counter() - self.phase
+		item["total"] = item["setup"] + item["render"] + item["post"]
+		self.items.append(item)
+		self.current = None
+		eta = self.eta()
+		print('VF Autosave Batch Render: {} of {} "{}" setup {} render {} post {} | remaining {}'.format(len(self.items), self.total, item["name"], secondsToReadable(item["setup"]), secondsToReadable(item["render"]), secondsToReadable(item["post"]), secondsToReadable(eta) if eta is not None else '-'))
+	
+	def eta(self):
+		if not self.items:
+			return None
+		return sum(item["total"] for item in self.items) / len(self.items) * (self.total - len(self.items))
+	
+	def finish(self):
+		if self.started is None:
+			return
+		elapsed = time.perf_counter() - self.started
+		self.started = None
+		print('VF Autosave Batch Render: {} items rendered in {}'.format(len(self.items), secondsToReadable(elapsed)))
+		# Limited to locations local to the project file
+		if not bpy.data.filepath or not self.items:
+			return
+		projectname = os.path.splitext(os.path.basename(bpy.data.filepath))[0]
+		summarypath = os.path.join(os.path.dirname(bpy.data.filepath), projectname + '-BatchTimes.csv')
+		try:
+			with open(summarypath, 'w', newline='') as fileout:
+				writer = csv.DictWriter(fileout, BATCH_SUMMARY_FIELDS)
+				writer.writeheader()
+				for item in self.items:
+					writer.writerow({key: round(value, 3) if isinstance(value, float) else value for key, value in item.items()})
+		except Exception as exc:
+			print(str(exc) + " | Error in VF Autosave Render: failed to save batch summary")
+
+batchTimer = BatchTimer()
+
 # Process batch rendering queue
 class VF_autosave_render_batch(bpy.types.Operator):
 	bl_idname = 'render.vf_autosave_render_batch'
@@ -1867,8 +3671,14 @@ class VF_autosave_render_batch(bpy.types.Operator):
 			# Set length of batch collection
 			batch_length = len(source_cameras) - 1
 			
+			# Start batch timing
+			batchTimer.start(batch_length + 1, context.scene.autosave_render_settings.batch_type)
+			
 			# Render each camera in the list
 			for cam in source_cameras:
+				# Start item timing (setup)
+				batchTimer.itemStart(cam.name)
+				
 				# Set batch values
 				context.scene.autosave_render_settings.batch_factor = context.scene.autosave_render_settings.batch_index / batch_length
 				context.scene.autosave_render_settings.batch_random = hash(context.scene.autosave_render_settings.batch_factor * 0.9998 + 0.0001) / 1000000 % 1
@@ -1889,12 +3699,14 @@ class VF_autosave_render_batch(bpy.types.Operator):
 					context.scene.render.resolution_y = original_resolution_y
 				
 				# Render
+				batchTimer.renderStart()
 				if context.scene.autosave_render_settings.batch_range == 'img':
 					# Render Still
 					bpy.ops.render.render(animation=False, write_still=True, use_viewport=True)
 				else:
 					# Sequence
 					bpy.ops.render.render(animation=True, use_viewport=True)
+				batchTimer.renderEnd()
 				
 				# Restore camera name if it was changed to remove the resolution
 				if resolution_match != None:
@@ -1903,6 +3715,9 @@ class VF_autosave_render_batch(bpy.types.Operator):
 				# Increment index value
 				context.scene.autosave_render_settings.batch_index += 1
 				
+				# Finish item timing
+				batchTimer.itemEnd()
+				
 			# Restore original active camera and render resolution
 			context.scene.camera = original_camera
 			context.scene.render.resolution_x = original_resolution_x
@@ -1945,8 +3760,14 @@ class VF_autosave_render_batch(bpy.types.Operator):
 			# Set length of batch collection
 			batch_length = len(source_collections) - 1
 			
+			# Start batch timing
+			batchTimer.start(batch_length + 1, context.scene.autosave_render_settings.batch_type)
+			
 			# Render each collection in the list
 			for col in source_collections:
+				# Start item timing (setup)
+				batchTimer.itemStart(col.name)
+				
 				# Set batch values
 				context.scene.autosave_render_settings.batch_factor = context.scene.autosave_render_settings.batch_index / batch_length
 				context.scene.autosave_render_settings.batch_random = hash(context.scene.autosave_render_settings.batch_factor * 0.9998 + 0.0001) / 1000000 % 1
@@ -1959,12 +3780,14 @@ class VF_autosave_render_batch(bpy.types.Operator):
 				col.exclude = False
 				
 				# Render
+				batchTimer.renderStart()
 				if context.scene.autosave_render_settings.batch_range == 'img':
 					# Render Still
 					bpy.ops.render.render(animation=False, write_still=True, use_viewport=True)
 				else:
 					# Sequence
 					bpy.ops.render.render(animation=True, use_viewport=True)
+				batchTimer.renderEnd()
 					
 				# Disable the collection again
 				col.collection.hide_render = True
@@ -1973,6 +3796,9 @@ class VF_autosave_render_batch(bpy.types.Operator):
 				# Increment index value
 				context.scene.autosave_render_settings.batch_index += 1
 				
+				# Finish item timing
+				batchTimer.itemEnd()
+				
 			# Restore enabled status
 			if len(source_collections_hidden) > 0 and len(source_collections_hidden) == len(source_collections_excluded):
 				for i, col in enumerate(source_collections):
@@ -2017,8 +3843,14 @@ class VF_autosave_render_batch(bpy.types.Operator):
 			# Set length of batch collection
 			batch_length = len(source_items) - 1
 			
+			# Start batch timing
+			batchTimer.start(batch_length + 1, context.scene.autosave_render_settings.batch_type)
+			
 			# Render each item in the list
 			for obj in source_items:
+				# Start item timing (setup)
+				batchTimer.itemStart(obj.name)
+				
 				# Set batch values
 				context.scene.autosave_render_settings.batch_factor = context.scene.autosave_render_settings.batch_index / batch_length
 				context.scene.autosave_render_settings.batch_random = hash(context.scene.autosave_render_settings.batch_factor * 0.9998 + 0.0001) / 1000000 % 1
@@ -2029,12 +3861,14 @@ class VF_autosave_render_batch(bpy.types.Operator):
 				obj.hide_render = False
 				
 				# Render
+				batchTimer.renderStart()
 				if context.scene.autosave_render_settings.batch_range == 'img':
 					# Render Still
 					bpy.ops.render.render(animation=False, write_still=True, use_viewport=True)
 				else:
 					# Sequence
 					bpy.ops.render.render(animation=True, use_viewport=True)
+				batchTimer.renderEnd()
 				
 				# Disable the object again (don't worry about active, next loop will reset it)
 				obj.select_set(False)
@@ -2042,6 +3876,9 @@ class VF_autosave_render_batch(bpy.types.Operator):
 				
 				# Increment index value
 				context.scene.autosave_render_settings.batch_index += 1
+				
+				# Finish item timing
+				batchTimer.itemEnd()
 			
 			# Restore render status
 			if len(source_items_hidden) > 0:
@@ -2095,8 +3932,14 @@ class VF_autosave_render_batch(bpy.types.Operator):
 			# Set length of batch collection
 			batch_length = len(source_images) - 1
 			
+			# Start batch timing
+			batchTimer.start(batch_length + 1, context.scene.autosave_render_settings.batch_type)
+			
 			# Batch render images (assumes we've already cancelled if there's an error with the folder)
 			for img_file in source_images:
+				# Start item timing (setup)
+				batchTimer.itemStart(img_file)
+				
 				# Set batch values
 				context.scene.autosave_render_settings.batch_factor = context.scene.autosave_render_settings.batch_index / batch_length
 				context.scene.autosave_render_settings.batch_random = hash(context.scene.autosave_render_settings.batch_factor * 0.9998 + 0.0001) / 1000000 % 1
@@ -2108,20 +3951,28 @@ class VF_autosave_render_batch(bpy.types.Operator):
 				target.image = image
 				
 				# Render
+				batchTimer.renderStart()
 				if context.scene.autosave_render_settings.batch_range == 'img':
 					# Render Still
 					bpy.ops.render.render(animation=False, write_still=True, use_viewport=True)
 				else:
 					# Sequence
 					bpy.ops.render.render(animation=True, use_viewport=True)
+				batchTimer.renderEnd()
 				
 				# Increment index value
 				context.scene.autosave_render_settings.batch_index += 1
+				
+				# Finish item timing
+				batchTimer.itemEnd()
 			
 			# Reset node to original texture, if previously assigned
 			if original_image:
 				target.image = original_image
 		
+		# Report batch timing and save the summary file
+		batchTimer.finish()
+		
 		# Restore manually entered batch index
 		context.scene.autosave_render_settings.batch_index = original_batch_index
 		
@@ -2445,6 +4296,26 @@ class VFTOOLS_PT_autosave_batch_setup(bpy.types.Panel):
 					batch_icon = 'RENDER_ANIMATION'
 				batch_text += 's' if batch_count > 1 else ''
 			button.operator(VF_autosave_render_batch.bl_idname, text=batch_text, icon=batch_icon)
+			
+			# Predicted batch render time
+			if batch_count > 0 and not batch_error:
+				prediction = predictRenderTime(context.scene, batch_count * (1 if context.scene.autosave_render_settings.batch_range == 'img' else sequenceFrameCount(context.scene)))
+				if prediction:
+					input3.label(text="Predicted time: " + secondsToReadable(prediction[0]), icon='TIME')
+			
+			# Progress and timing of the current or most recent batch
+			if batchTimer.items:
+				box = layout.box()
+				column = box.column(align=True)
+				if batchTimer.started is not None:
+					eta = batchTimer.eta()
+					column.label(text="Rendered " + str(len(batchTimer.items)) + " of " + str(batchTimer.total) + ", " + secondsToReadable(eta) + " remaining", icon='TIME')
+				else:
+					column.label(text="Last batch: " + str(len(batchTimer.items)) + " items in " + secondsToReadable(sum(item["total"] for item in batchTimer.items)), icon='TIME')
+				count = len(batchTimer.items)
+				column.label(text="Average setup " + secondsToReadable(sum(item["setup"] for item in batchTimer.items) / count))
+				column.label(text="Average render " + secondsToReadable(sum(item["render"] for item in batchTimer.items) / count))
+				column.label(text="Average post " + secondsToReadable(sum(item["post"] for item in batchTimer.items) / count))
 
 
 
@@ -2454,27 +4325,53 @@ class VFTOOLS_PT_autosave_batch_setup(bpy.types.Panel):
 # •Registration function
 # •Unregistration function
 
-classes = (AutosaveRenderPreferences, AutosaveRenderSettings, RENDER_PT_autosave_video, RENDER_PT_autosave_render, AutosaveRenderVariablePopup, AutosaveRenderCopyToClipboard, VF_autosave_render_batch_assign_image_target, VF_autosave_render_batch, VF_autosave_render_batch_camera_update, VFTOOLS_PT_autosave_batch_setup)
+classes = (AutosaveRenderPreferences, AutosaveRenderSettings, RENDER_PT_autosave_video, RENDER_PT_autosave_render, AutosaveRenderVariablePopup, AutosaveRenderCopyToClipboard, AutosaveRenderRefreshSystemVariables, VF_autosave_render_batch_assign_image_target, VF_autosave_render_batch, VF_autosave_render_batch_camera_update, VFTOOLS_PT_autosave_batch_setup)
+
+# Add-on load times in milliseconds, displayed in the preferences and printed when Blender is started with --debug
+loadTiming = {"import": 0.0, "register": 0.0}
 
 def register():
+	registerStart = time.perf_counter()
 	for cls in classes:
 		bpy.utils.register_class(cls)
 	# Settings reference
 	bpy.types.Scene.autosave_render_settings = bpy.props.PointerProperty(type=AutosaveRenderSettings)
 	# Rendering events
 	bpy.app.handlers.render_init.append(autosave_render_start)
+	bpy.app.handlers.render_pre.append(autosave_render_frame)
 	bpy.app.handlers.render_post.append(autosave_render_estimate)
+	bpy.app.handlers.render_post.append(autosave_render_journal)
+	bpy.app.handlers.render_write.append(autosave_render_write)
+	bpy.app.handlers.render_cancel.append(autosave_render_cancel)
 	bpy.app.handlers.render_cancel.append(autosave_render_end)
+	bpy.app.handlers.render_complete.append(autosave_render_complete)
 	bpy.app.handlers.render_complete.append(autosave_render_end)
+	bpy.app.handlers.render_cancel.append(autosave_render_profile)
+	bpy.app.handlers.render_complete.append(autosave_render_profile)
+	# Project load events
+	bpy.app.handlers.load_post.append(autosave_render_load)
+	# File Output node index events
+	bpy.app.handlers.depsgraph_update_post.append(autosave_render_index_update)
+	bpy.app.handlers.depsgraph_update_post.append(autosave_render_statistics_clear)
+	bpy.app.handlers.undo_post.append(autosave_render_index_clear)
+	bpy.app.handlers.redo_post.append(autosave_render_index_clear)
 	# Render estimate display
 	bpy.types.IMAGE_MT_editor_menus.append(image_viewer_feedback_display)
 	# Variable info popup
 	bpy.types.RENDER_PT_output.prepend(RENDER_PT_output_path_variable_list)
 	bpy.types.RENDER_PT_output.append(RENDER_PT_total_render_time_display)
+	bpy.types.RENDER_PT_output.append(RENDER_PT_predicted_render_time_display)
+	bpy.types.RENDER_PT_output.append(RENDER_PT_profile_display)
 	bpy.types.NODE_PT_active_node_properties.prepend(NODE_PT_output_path_variable_list)
-	## Update FFmpeg location
-	bpy.context.preferences.addons[__name__].preferences.check_ffmpeg_location()
-	bpy.context.preferences.addons[__name__].preferences.check_macos_say_location()
+	## Check FFmpeg and MacOS Say locations once the interface has started (background renders check when first needed)
+	if not bpy.app.background:
+		bpy.app.timers.register(autosave_render_check_tools, first_interval=1.0)
+	# Restore the profiling state from saved preferences
+	profileState["enabled"] = bpy.context.preferences.addons['VF_autosaveRender'].preferences.profiling
+	# Report load times
+	loadTiming["register"] = (time.perf_counter() - registerStart) * 1000.0
+	if bpy.app.debug:
+		print('VF Autosave Render: imported in {:.2f} ms, registered in {:.2f} ms'.format(loadTiming["import"], loadTiming["register"]))
 
 def unregister():
 	for cls in reversed(classes):
@@ -2483,15 +4380,39 @@ def unregister():
 	del bpy.types.Scene.autosave_render_settings
 	# Rendering events
 	bpy.app.handlers.render_init.remove(autosave_render_start)
+	bpy.app.handlers.render_pre.remove(autosave_render_frame)
 	bpy.app.handlers.render_post.remove(autosave_render_estimate)
+	bpy.app.handlers.render_post.remove(autosave_render_journal)
+	bpy.app.handlers.render_write.remove(autosave_render_write)
+	bpy.app.handlers.render_cancel.remove(autosave_render_cancel)
 	bpy.app.handlers.render_cancel.remove(autosave_render_end)
+	bpy.app.handlers.render_complete.remove(autosave_render_complete)
 	bpy.app.handlers.render_complete.remove(autosave_render_end)
+	bpy.app.handlers.render_cancel.remove(autosave_render_profile)
+	bpy.app.handlers.render_complete.remove(autosave_render_profile)
+	# Project load events
+	bpy.app.handlers.load_post.remove(autosave_render_load)
+	# File Output node index events
+	bpy.app.handlers.depsgraph_update_post.remove(autosave_render_index_update)
+	bpy.app.handlers.depsgraph_update_post.remove(autosave_render_statistics_clear)
+	bpy.app.handlers.undo_post.remove(autosave_render_index_clear)
+	bpy.app.handlers.redo_post.remove(autosave_render_index_clear)
 	# Render estimate display
 	bpy.types.IMAGE_MT_editor_menus.remove(image_viewer_feedback_display)
 	# Variable info popup
 	bpy.types.RENDER_PT_output.remove(RENDER_PT_output_path_variable_list)
 	bpy.types.RENDER_PT_output.remove(RENDER_PT_total_render_time_display)
+	bpy.types.RENDER_PT_output.remove(RENDER_PT_predicted_render_time_display)
+	bpy.types.RENDER_PT_output.remove(RENDER_PT_profile_display)
 	bpy.types.NODE_PT_active_node_properties.remove(NODE_PT_output_path_variable_list)
+	# Deferred tool checks
+	if bpy.app.timers.is_registered(autosave_render_check_tools):
+		bpy.app.timers.unregister(autosave_render_check_tools)
+	if bpy.app.timers.is_registered(autosave_render_ffmpeg_poll):
+		bpy.app.timers.unregister(autosave_render_ffmpeg_poll)
+	clearFFmpegInputCache()
+
+loadTiming["import"] = (time.perf_counter() - loadStart) * 1000.0
 
 if __name__ == "__main__":
 	register()
\ No newline at end of file
@@ -0,0 +1,257 @@
+# VF Autosave Render benchmarks
+# •Times variable replacement, time formatting, the autosave serial scan, the File Output node index, and the render handlers
+# •Runs without Blender using the minimal bpy module in this folder
+# •Compares results against the stored baseline and reports regressions
+#
+# Usage:
+#	python3 benchmarks/benchmark.py					Run all benchmarks and compare against baseline.json
+#	python3 benchmarks/benchmark.py --save				Run all benchmarks and save the results as the new baseline
+#	python3 benchmarks/benchmark.py --quick				Run a tenth of the iterations for a quick check
+#	python3 benchmarks/benchmark.py replace handlers	Run only benchmarks with names containing any of the arguments
+#
+# Results are stored as microseconds per operation, so quick and full runs can be compared against the same baseline.
+# Baselines are only meaningful on the machine they were recorded on; save a new baseline before comparing changes.
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCHMARK_DIR))
+sys.path.insert(0, BENCHMARK_DIR)
+
+import bpy
+from bpy import NS
+from bpy.types import CompositorNodeOutputFile, NodeGroups, NodeTree, Nodes
+
+import VF_autosaveRender as addon
+
+BASELINE_PATH = os.path.join(BENCHMARK_DIR, 'baseline.json')
+
+
+
+###########################################################################
+# Fake project
+# •Scene with Cycles render settings, an active object, material, and texture node
+# •Compositor with a large node tree, File Output nodes, and a nested node group
+# •Add-on preferences and project settings with their default values
+
+def buildProject(directory):
+	bpy.data.filepath = os.path.join(directory, 'Benchmark.blend')
+	
+	view_settings = NS(view_transform='Filmic', look='None', exposure=0.0, gamma=1.0, use_curve_mapping=False)
+	display_settings = NS(display_device='sRGB')
+	image_settings = NS(color_management='FOLLOW_SCENE', file_format='PNG', color_mode='RGBA', color_depth='8', display_settings=display_settings, view_settings=view_settings)
+	render = NS(filepath='//render/{project}_{camera}_{frame}_####', image_settings=image_settings, file_extension='.png', fps=24, fps_base=1.0, use_overwrite=True)
+	render.frame_path = lambda frame: bpy.path.abspath(render.filepath).replace('####', format(frame, '04')) + render.file_extension
+	
+	inner = NodeTree(name='Outputs', nodes=Nodes([CompositorNodeOutputFile('File Output', '//nodes/{camera}/', ['beauty_{frame}_', 'depth_{frame}_'])]))
+	bpy.data.node_groups = NodeGroups(Outputs=inner)
+	nodes = [NS(name='Render Layers', type='R_LAYERS')]
+	nodes += [NS(name='Mix.%03d' % index, type='MIX') for index in range(1000)]
+	nodes += [CompositorNodeOutputFile('File Output', '//comp/{project}/', ['image_{engine}_', 'mask'])]
+	nodes += [NS(name='Group', type='GROUP', node_tree=inner)]
+	tree = NodeTree(name='Compositing', nodes=Nodes(nodes))
+	
+	scene = NS(
+		name='Scene',
+		camera=NS(name='Camera'),
+		render=render,
+		view_settings=view_settings,
+		display_settings=display_settings,
+		use_nodes=True,
+		node_tree=tree,
+		frame_current=1,
+		frame_start=1,
+		frame_end=250,
+		frame_step=1,
+		autosave_render_settings=addon.AutosaveRenderSettings(),
+		cycles=NS(device='GPU', samples=4096, adaptive_threshold=0.01, adaptive_min_samples=0, max_bounces=12, diffuse_bounces=4, glossy_bounces=4, transmission_bounces=12, volume_bounces=0, transparent_max_bounces=8))
+	
+	material = NS(name='Material', use_nodes=True, node_tree=NS(nodes=NS(active=NS(type='TEX_IMAGE', name='Image Texture', image=NS(name='texture.png')))))
+	
+	prefs = addon.AutosaveRenderPreferences()
+	prefs.ffmpeg_processing = False
+	prefs.minimum_time = 1000000
+	
+	bpy.context.scene = scene
+	bpy.context.engine = 'CYCLES'
+	bpy.context.view_layer = NS(name='ViewLayer', objects=NS(active=NS(name='Cube', active_material=material)))
+	bpy.context.collection = NS(name='Collection')
+	bpy.context.preferences = NS(addons={'VF_autosaveRender': NS(preferences=prefs)})
+	bpy.data.scenes = [scene]
+	bpy.data.images = {'Render Result': NS(save_render=lambda filepath, scene=None: None)}
+	return scene
+
+
+
+###########################################################################
+# Benchmarks
+# •Optional setup functions prepare fixtures outside of the timed section
+# •Each benchmark runs its operation count times and returns the number of operations
+
+TEMPLATES = (
+	'//render/{project}/{scene}_{camera}_{frame}',
+	'{project} {engine} {device} {samples} {duration}',
+	'{date} {time} {host} {blender} {serial}',
+	'{display}-{colorspace}-{look}-{exposure}-{gamma}')
+
+def benchReplaceVariables(scene, count):
+	snapshot = addon.captureRenderSnapshot()
+	for index in range(count):
+		addon.replaceVariables(TEMPLATES[index % 4], rendertime=12.5, serial=index, snapshot=snapshot)
+	return count
+
+def benchReplaceVariablesBulk(scene, count):
+	snapshot = addon.captureRenderSnapshot()
+	for path in addon.replaceVariablesBulk(TEMPLATES[0], frames=range(count), snapshot=snapshot):
+		pass
+	return count
+
+def benchSecondsToStrings(scene, count):
+	for index in range(count):
+		addon.secondsToStrings(index * 1.37)
+	return count
+
+def benchReadableToSeconds(scene, count):
+	readable = [addon.secondsToReadable(index * 13.7) for index in range(1000)]
+	for index in range(count):
+		addon.readableToSeconds(readable[index % 1000])
+	return count
+
+def benchFileOutputIndex(scene, count):
+	for index in range(count):
+		addon.fileOutputIndex.clear()
+		addon.getFileOutputNodes(scene)
+	return count
+
+def setupSerialScan(scene):
+	# Autosave folder that already holds thousands of numbered images
+	directory = os.path.join(os.path.dirname(bpy.data.filepath), 'Benchmark')
+	os.makedirs(directory, exist_ok=True)
+	for index in range(5000):
+		open(os.path.join(directory, 'Benchmark-%04d.png' % index), 'w').close()
+	scene.render.filepath = '//render/still'
+	scene.use_nodes = False
+
+def benchSerialScan(scene, count):
+	# Still image render, autosaved with the next serial number in the folder
+	for index in range(count):
+		addon.autosave_render_start(scene)
+		addon.autosave_render_end(scene)
+	return count
+
+def setupHandlers(scene):
+	prefs = bpy.context.preferences.addons['VF_autosaveRender'].preferences
+	prefs.render_output_variables_frame = True
+	prefs.frame_journal = True
+	prefs.enable_autosave_render = False
+
+def benchHandlers(scene, count):
+	# Full animation render with per-frame variables, File Output nodes, and the frame time journal
+	scene.frame_start = scene.frame_current = 1
+	scene.frame_end = count
+	addon.autosave_render_start(scene)
+	for frame in range(1, count + 1):
+		scene.frame_current = frame
+		addon.autosave_render_frame(scene)
+		addon.autosave_render_estimate(scene)
+		addon.autosave_render_journal(scene)
+	addon.autosave_render_end(scene)
+	return count
+
+# Name, setup function, benchmark function, operation count
+BENCHMARKS = (
+	('replaceVariables', None, benchReplaceVariables, 100000),
+	('replaceVariablesBulk', None, benchReplaceVariablesBulk, 100000),
+	('secondsToStrings', None, benchSecondsToStrings, 100000),
+	('readableToSeconds', None, benchReadableToSeconds, 100000),
+	('fileOutputIndex', None, benchFileOutputIndex, 1000),
+	('serialScan', setupSerialScan, benchSerialScan, 20),
+	('handlers', setupHandlers, benchHandlers, 10000))
+
+
+
+###########################################################################
+# Runner
+
+def run(names, scale, repeat):
+	results = {}
+	for name, setup, function, count in BENCHMARKS:
+		if names and not any(filter in name for filter in names):
+			continue
+		count = max(int(count * scale), 1)
+		best = None
+		# Best of several runs, each in a fresh project
+		for attempt in range(repeat):
+			with tempfile.TemporaryDirectory() as directory:
+				scene = buildProject(directory)
+				if setup:
+					setup(scene)
+				start = time.perf_counter()
+				operations = function(scene, count)
+				elapsed = time.perf_counter() - start
+			best = elapsed / operations if best is None else min(best, elapsed / operations)
+		results[name] = round(best * 1000000.0, 4)
+		print('{:<24}{:>12.3f} µs per operation  ({} operations)'.format(name, results[name], count))
+	return results
+
+def compare(results, baseline, tolerance):
+	regressions = []
+	print('')
+	print('{:<24}{:>12}{:>12}{:>10}'.format('Benchmark', 'Baseline', 'Current', 'Ratio'))
+	for name, current in results.items():
+		previous = baseline.get(name)
+		if not previous:
+			print('{:<24}{:>12}{:>12.3f}{:>10}'.format(name, '-', current, 'new'))
+			continue
+		ratio = current / previous
+		status = ''
+		if ratio > 1.0 + tolerance:
+			status = '  REGRESSION'
+			regressions.append(name)
+		elif ratio < 1.0 - tolerance:
+			status = '  improved'
+		print('{:<24}{:>12.3f}{:>12.3f}{:>10.2f}{}'.format(name, previous, current, ratio, status))
+	return regressions
+
+def main():
+	parser = argparse.ArgumentParser(description='Benchmark VF Autosave Render without Blender')
+	parser.add_argument('names', nargs='*', help='only run benchmarks with names containing any of these strings')
+	parser.add_argument('--save', action='store_true', help='save results as the new baseline')
+	parser.add_argument('--quick', action='store_true', help='run a tenth of the operations')
+	parser.add_argument('--repeat', type=int, default=3, help='number of runs per benchmark, keeping the fastest (default 3)')
+	parser.add_argument('--tolerance', type=float, default=0.25, help='allowed slowdown before reporting a regression (default 0.25)')
+	parser.add_argument('--baseline', default=BASELINE_PATH, help='baseline file (default benchmarks/baseline.json)')
+	args = parser.parse_args()
+	
+	results = run(args.names, 0.1 if args.quick else 1.0, args.repeat)
+	
+	if args.save:
+		baseline = {}
+		if os.path.exists(args.baseline):
+			with open(args.baseline) as filein:
+				baseline = json.load(filein)
+		baseline.update(results)
+		with open(args.baseline, 'w') as fileout:
+			json.dump(baseline, fileout, indent='\t', sort_keys=True)
+			fileout.write('\n')
+		print('\nSaved baseline to ' + args.baseline)
+		return 0
+	
+	if not os.path.exists(args.baseline):
+		print('\nNo baseline found, run with --save to create one')
+		return 0
+	with open(args.baseline) as filein:
+		baseline = json.load(filein)
+	regressions = compare(results, baseline, args.tolerance)
+	if regressions:
+		print('\nRegressions: ' + ', '.join(regressions))
+		return 1
+	return 0
+
+if __name__ == '__main__':
+	sys.exit(main())
@@ -0,0 +1,140 @@
+# Minimal stand-in for the Blender Python API, only covering what VF Autosave Render touches
+# •Property definitions become plain attributes with their default values
+# •Scenes, render settings, and node trees are simple namespaces assembled by the benchmark script
+# •Registration, menus, and timers record calls without doing anything
+
+import os
+import sys
+import types as moduletypes
+
+class NS:
+	def __init__(self, **kwargs):
+		self.__dict__.update(kwargs)
+	
+	def as_pointer(self):
+		return id(self)
+
+
+
+###########################################################################
+# Properties
+
+class Property:
+	def __init__(self, kind, **kwargs):
+		self.kind = kind
+		self.kwargs = kwargs
+
+PROPERTY_DEFAULTS = {
+	'BoolProperty': False,
+	'StringProperty': '',
+	'IntProperty': 0,
+	'FloatProperty': 0.0}
+
+props = moduletypes.ModuleType('bpy.props')
+for kind in ('BoolProperty', 'StringProperty', 'IntProperty', 'FloatProperty', 'EnumProperty', 'PointerProperty', 'CollectionProperty'):
+	setattr(props, kind, lambda kind=kind, **kwargs: Property(kind, **kwargs))
+
+
+
+###########################################################################
+# Types
+
+class StructBase:
+	def __init__(self):
+		# Initialise annotated properties with their defaults, like a registered property group
+		for cls in reversed(type(self).__mro__):
+			for name, prop in getattr(cls, '__annotations__', {}).items():
+				if isinstance(prop, Property):
+					default = prop.kwargs.get('default')
+					setattr(self, name, PROPERTY_DEFAULTS.get(prop.kind) if default is None else default)
+
+class MenuBase:
+	@classmethod
+	def append(cls, function):
+		pass
+	
+	@classmethod
+	def prepend(cls, function):
+		pass
+	
+	@classmethod
+	def remove(cls, function):
+		pass
+
+class NodeTree(NS):
+	pass
+
+class Nodes(list):
+	def get(self, name):
+		for node in self:
+			if node.name == name:
+				return node
+
+class NodeGroups(dict):
+	pass
+
+class CompositorNodeOutputFile(NS):
+	type = 'OUTPUT_FILE'
+	
+	def __init__(self, name, base_path, slots):
+		super().__init__(name=name, base_path=base_path, file_slots=[NS(path=path) for path in slots])
+
+types = moduletypes.ModuleType('bpy.types')
+for name in ('Operator', 'Panel', 'PropertyGroup', 'AddonPreferences', 'Scene'):
+	setattr(types, name, type(name, (StructBase,), {}))
+for name in ('RENDER_PT_output', 'IMAGE_MT_editor_menus', 'NODE_PT_active_node_properties'):
+	setattr(types, name, type(name, (MenuBase,), {}))
+types.NodeTree = NodeTree
+types.Nodes = Nodes
+types.NodeGroups = NodeGroups
+types.CompositorNodeOutputFile = CompositorNodeOutputFile
+types.RenderEngine = type('RenderEngine', (), {})
+
+
+
+###########################################################################
+# Application
+
+app = moduletypes.ModuleType('bpy.app')
+app.version_string = '3.6.0'
+app.version_cycle = 'release'
+app.background = True
+
+handlers = moduletypes.ModuleType('bpy.app.handlers')
+handlers.persistent = lambda function: function
+for name in ('render_init', 'render_pre', 'render_post', 'render_write', 'render_cancel', 'render_complete', 'load_post', 'save_pre', 'depsgraph_update_post', 'undo_post', 'redo_post'):
+	setattr(handlers, name, [])
+app.handlers = handlers
+
+timers = moduletypes.ModuleType('bpy.app.timers')
+timers.registered = []
+timers.register = lambda function, first_interval=0, persistent=False: timers.registered.append(function)
+timers.unregister = lambda function: timers.registered.remove(function) if function in timers.registered else None
+timers.is_registered = lambda function: function in timers.registered
+app.timers = timers
+
+
+
+###########################################################################
+# Paths, utilities, data, and context
+
+path = moduletypes.ModuleType('bpy.path')
+path.extensions_image = {'.bmp', '.png', '.jpg', '.jp2', '.tga', '.cin', '.dpx', '.exr', '.hdr', '.tif'}
+
+def abspath(filepath):
+	if filepath.startswith('//'):
+		return os.path.join(os.path.dirname(data.filepath), filepath[2:])
+	return filepath
+path.abspath = abspath
+
+utils = moduletypes.ModuleType('bpy.utils')
+utils.register_class = lambda cls: None
+utils.unregister_class = lambda cls: None
+utils.user_resource = lambda resource_type, path='', create=False: os.path.join(os.path.dirname(data.filepath), 'config', path)
+
+data = NS(filepath='', scenes=[], materials={}, images={}, node_groups=NodeGroups())
+context = NS()
+ops = NS()
+
+for module in (props, types, app, handlers, timers, path, utils):
+	sys.modules[module.__name__] = module